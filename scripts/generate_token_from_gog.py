@@ -6,6 +6,7 @@ via the gog (Gmail/Calendar) skill if available, otherwise falls back to
 standard OAuth flow.
 """
 
+import re
 import sys
 import json
 import logging
@@ -18,6 +19,9 @@ from src import config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Calendar ID lines in .env, rewritten in a single pass
+ENV_ID_PATTERN = re.compile(r"^(ASHI_CALENDAR_ID|SINDI_CALENDAR_ID)=.*$", re.M)
+
 def get_calendars_from_gog():
     """Get calendars using gog skill (if available)."""
     try:
@@ -76,25 +80,23 @@ def main():
     # Update .env with calendar IDs
     env_path = Path(".env")
     if env_path.exists():
-        with open(env_path, "r") as f:
-            env_content = f.read()
-        
-        if ashi_id:
-            env_content = env_content.replace(
-                "ASHI_CALENDAR_ID=your-ashi-calendar-id@gmail.com",
-                f"ASHI_CALENDAR_ID={ashi_id}"
-            )
-        
-        if sindi_id:
-            env_content = env_content.replace(
-                "SINDI_CALENDAR_ID=your-sindi-calendar-id@gmail.com",
-                f"SINDI_CALENDAR_ID={sindi_id}"
-            )
+        buf = bytearray(env_path.stat().st_size)
+        with open(env_path, "rb", buffering=0) as f:
+            f.readinto(buf)
+        env_content = buf.decode("utf-8")
         
-        with open(env_path, "w") as f:
-            f.write(env_content)
+        subs = {"ASHI_CALENDAR_ID": ashi_id, "SINDI_CALENDAR_ID": sindi_id}
+        new_content = ENV_ID_PATTERN.sub(
+            lambda m: f"{m.group(1)}={subs[m.group(1)]}" if subs[m.group(1)] else m.group(0),
+            env_content
+        )
         
-        print("\n✓ Updated .env with calendar IDs")
+        if new_content != env_content:
+            with open(env_path, "w") as f:
+                f.write(new_content)
+            print("\n✓ Updated .env with calendar IDs")
+        else:
+            print("\n✓ .env already has these calendar IDs")
     
     print("\n" + "=" * 60)
     print("Next Steps:")
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Render an empty calendar to a PNG, without hardware or credentials."""
+
+import sys
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.display_renderer import DisplayRenderer
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
+    # Test renderer
+    renderer = DisplayRenderer(800, 480, "red")
+    img = renderer.render([], [])
+    renderer.save(img, "test_display.png")
+    print("Test image saved to test_display.png")
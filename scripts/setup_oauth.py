@@ -4,7 +4,6 @@
 import sys
 import logging
 from pathlib import Path
-import pickle
 import json
 
 # Add parent to path
@@ -22,6 +21,17 @@ logger = logging.getLogger(__name__)
 # Google Calendar API scopes
 SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
 
+def _read_bytes(path: Path) -> bytearray:
+    """Read a whole file with a single unbuffered readinto() call."""
+    buf = bytearray(path.stat().st_size)
+    with open(path, "rb", buffering=0) as f:
+        f.readinto(buf)
+    return buf
+
+def _load_token(token_path: Path) -> Credentials:
+    """Load saved OAuth credentials from token.json."""
+    return Credentials.from_authorized_user_info(json.loads(_read_bytes(token_path)), SCOPES)
+
 def generate_oauth_credentials():
     """Generate OAuth credentials for Google Calendar API.
     
@@ -60,8 +70,8 @@ def generate_oauth_credentials():
         creds = flow.run_local_server(port=0)
         
         # Save token
-        with open(token_path, "wb") as token_file:
-            pickle.dump(creds, token_file)
+        with open(token_path, "w") as token_file:
+            token_file.write(creds.to_json())
         
         logger.info(f"Token saved to: {token_path}")
         logger.info("OAuth setup complete!")
@@ -84,16 +94,15 @@ def refresh_token():
         return False
     
     try:
-        with open(token_path, "rb") as token_file:
-            creds = pickle.load(token_file)
+        creds = _load_token(token_path)
         
         if creds.expired and creds.refresh_token:
             logger.info("Token expired, refreshing...")
             creds.refresh(Request())
             
             # Save refreshed token
-            with open(token_path, "wb") as token_file:
-                pickle.dump(creds, token_file)
+            with open(token_path, "w") as token_file:
+                token_file.write(creds.to_json())
             
             logger.info("Token refreshed successfully")
             return True
@@ -126,8 +135,7 @@ def verify_credentials():
         print(f"✓ Token file: {token_path}")
         
         try:
-            with open(token_path, "rb") as f:
-                creds = pickle.load(f)
+            creds = _load_token(token_path)
             
             print(f"✓ Token is valid (scopes: {len(creds.scopes)} scope(s))")
             
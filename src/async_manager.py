@@ -3,21 +3,42 @@ Async manager for parallel API fetching with error handling and fallback.
 """
 import asyncio
 import logging
-from typing import Optional, Tuple, List
-from datetime import datetime
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple, List, Dict
+from datetime import datetime, timezone
 
-from src.calendar_fetcher import CalendarFetcher
+import aiohttp
+
+from src.calendar_fetcher import CalendarFetcher, load_credentials, save_credentials
+from src.config import CREDENTIALS_PATH, TOKEN_PATH
 from src.providers.base import WeatherData
 from src.providers.weather.openweather import OpenWeatherMapProvider
 from src.cache_manager import CacheManager
 
+# google-auth is imported where first needed, as in calendar_fetcher
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
 
 logger = logging.getLogger(__name__)
 
 
+def _safe(result):
+    """Return a gather() result, or None if it is an exception."""
+    return None if isinstance(result, Exception) else result
+
+
 class AsyncManager:
     """Manages parallel API fetching for calendar and weather."""
 
+    # Refresh OAuth tokens this many seconds before they expire
+    TOKEN_REFRESH_MARGIN = 300
+    # Retry delay after a failed background refresh
+    TOKEN_RETRY_DELAY = 60
+    # Google access tokens live for one hour
+    TOKEN_LIFETIME = 3600
+
     def __init__(self, config: dict, cache_manager: CacheManager):
         """
         Initialize async manager.
@@ -30,14 +51,31 @@ class AsyncManager:
         self.cache = cache_manager
         self.calendar_fetcher = None
         self.weather_provider = None
+        self.credentials_path = Path(config.get("credentials_path", CREDENTIALS_PATH))
+        self.token_path = Path(config.get("token_path", TOKEN_PATH))
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._cached_creds: Optional["Credentials"] = None
+        self._creds_expiry: float = 0
 
     async def initialize(self) -> None:
         """Initialize calendar and weather providers."""
         try:
-            # Initialize calendar fetcher
-            self.calendar_fetcher = CalendarFetcher(self.config)
+            # Initialize calendar fetcher with the shared in-memory credentials
+            creds = await self._get_creds()
+            self.calendar_fetcher = CalendarFetcher(
+                str(self.credentials_path),
+                str(self.token_path),
+                self.cache,
+                credentials=creds,
+            )
+            # One HTTP session reused across polls for keep-alive
+            self._http = aiohttp.ClientSession()
             logger.info("Calendar fetcher initialized")
 
+            # Keep the OAuth token fresh off the fetch path
+            self._refresh_task = asyncio.create_task(self._token_watchdog())
+
             # Initialize weather provider if API key is configured
             if self.config.get("openweather_api_key"):
                 self.weather_provider = OpenWeatherMapProvider(
@@ -51,28 +89,27 @@ class AsyncManager:
             logger.error(f"Failed to initialize providers: {e}")
             raise
 
-    async def fetch_all(self) -> Tuple[Optional[List[dict]], Optional[WeatherData]]:
+    async def fetch_all(self) -> Tuple[Optional[Dict[str, List[dict]]], Optional[WeatherData]]:
         """
         Fetch calendar events and weather in parallel.
         
         Returns:
-            Tuple of (events list, weather data)
+            Tuple of (events dict keyed by calendar name, weather data)
         """
         if not self.calendar_fetcher:
             logger.warning("Providers not initialized, cannot fetch")
             return None, None
 
         try:
-            # Create tasks for parallel execution
-            tasks = [
-                self._fetch_calendar(),
-                self._fetch_weather() if self.weather_provider else asyncio.sleep(0),
-            ]
+            # Only schedule the work that is actually configured
+            tasks = [self._fetch_calendar()]
+            if self.weather_provider:
+                tasks.append(self._fetch_weather())
 
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            events = results[0] if not isinstance(results[0], Exception) else None
-            weather = results[1] if len(results) > 1 and not isinstance(results[1], Exception) else None
+            events = _safe(results[0])
+            weather = _safe(results[1]) if len(results) > 1 else None
 
             return events, weather
 
@@ -80,31 +117,39 @@ class AsyncManager:
             logger.error(f"Error in parallel fetch: {e}")
             return None, None
 
-    async def _fetch_calendar(self) -> Optional[List[dict]]:
+    async def _fetch_calendar(self) -> Optional[Dict[str, List[dict]]]:
         """
-        Fetch calendar events.
+        Fetch calendar events for all calendars concurrently.
         
         Returns:
-            List of events or None on error
+            Events dict keyed by calendar name, or None on error
         """
         try:
             logger.debug("Fetching calendar events")
-            
-            # Try to fetch from API
-            events = await asyncio.to_thread(self.calendar_fetcher.get_events)
-            
-            if events:
-                # Cache the events
-                self.cache.cache_events(events)
-                logger.info(f"Fetched {len(events)} events from API")
-                return events
-            else:
-                logger.warning("No events returned from API, using cache")
-                return self.cache.get_cached_events()
+
+            creds = await self._get_creds()
+            if not creds:
+                logger.warning("No OAuth token available, using cache")
+                return await asyncio.to_thread(self.calendar_fetcher.get_cached_calendars)
+
+            # Inline fallback in case the watchdog missed the expiry (clock skew)
+            if not creds.valid and creds.refresh_token:
+                from google.auth.transport.requests import Request
+
+                await asyncio.to_thread(creds.refresh, Request())
+                await asyncio.to_thread(save_credentials, self.token_path, creds)
+                self._cache_creds(creds)
+
+            events, success = await self.calendar_fetcher.fetch_all_calendars_async(
+                self._http, creds.token
+            )
+            logger.info(f"Fetched {sum(len(e) for e in events.values())} events "
+                        f"({sum(success.values())}/{len(success)} calendars online)")
+            return events
 
         except Exception as e:
             logger.error(f"Calendar fetch failed: {e}, using cache")
-            return self.cache.get_cached_events()
+            return await asyncio.to_thread(self.calendar_fetcher.get_cached_calendars)
 
     async def _fetch_weather(self) -> Optional[WeatherData]:
         """
@@ -150,8 +195,75 @@ class AsyncManager:
             logger.error(f"Weather forecast fetch failed: {e}")
             return []
 
+    async def _get_creds(self) -> Optional["Credentials"]:
+        """
+        Get OAuth credentials, reading token.json only when the cached copy is stale.
+        
+        Returns:
+            Credentials or None if no token is available
+        """
+        if self._cached_creds and time.monotonic() < self._creds_expiry - self.TOKEN_REFRESH_MARGIN:
+            return self._cached_creds
+
+        try:
+            creds = await asyncio.to_thread(load_credentials, self.token_path)
+        except Exception as e:
+            logger.warning(f"Failed to load token: {e}")
+            return None
+
+        self._cache_creds(creds)
+        return creds
+
+    def _cache_creds(self, creds: Optional["Credentials"]) -> None:
+        """Store credentials in the in-memory cache for one token lifetime."""
+        self._cached_creds = creds
+        self._creds_expiry = time.monotonic() + self.TOKEN_LIFETIME if creds else 0
+
+    async def _token_watchdog(self) -> None:
+        """Refresh the OAuth token shortly before it expires, in the background."""
+        from google.auth.transport.requests import Request
+
+        while True:
+            try:
+                creds = await self._get_creds()
+            except Exception as e:
+                logger.warning(f"Token watchdog could not load token: {e}")
+                return
+
+            if not creds or not creds.refresh_token:
+                logger.debug("No refreshable token, token watchdog stopping")
+                return
+
+            if creds.expiry:
+                # google-auth stores expiry as naive UTC
+                expiry = creds.expiry
+                if expiry.tzinfo is None:
+                    expiry = expiry.replace(tzinfo=timezone.utc)
+                remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+                delay = remaining - self.TOKEN_REFRESH_MARGIN
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            try:
+                await asyncio.to_thread(creds.refresh, Request())
+                await asyncio.to_thread(save_credentials, self.token_path, creds)
+                self._cache_creds(creds)
+                logger.info("Refreshed OAuth token in background")
+            except Exception as e:
+                logger.warning(f"Background token refresh failed: {e}")
+                await asyncio.sleep(self.TOKEN_RETRY_DELAY)
+
     async def shutdown(self) -> None:
         """Cleanup resources."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        if self._http:
+            await self._http.close()
         if self.weather_provider:
             await self.weather_provider.close()
+        self.cache.close()
         logger.info("Async manager shutdown complete")
@@ -3,12 +3,66 @@
 import sqlite3
 import json
 import logging
-from datetime import datetime
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # stdlib fallback; json.loads also accepts bytes
+    orjson = None
+    _dumps = json.dumps
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Fixed query text per filter combination, so sqlite3's per-connection
+# statement cache can reuse the prepared statement across calls
+_SELECT_ALL = "SELECT {cols} FROM events"
+_SELECT_CAL = "SELECT {cols} FROM events WHERE calendar_id = ?"
+_SELECT_CAL_RANGE = (
+    "SELECT {cols} FROM events WHERE calendar_id = ? "
+    "AND start_time >= ? AND start_time <= ?"
+)
+_SELECT_RANGE = "SELECT {cols} FROM events WHERE start_time >= ? AND start_time <= ?"
+
+# Supported get_events orderings (walked via idx_start_time / idx_cal_start)
+_ORDER_BY = {"start": " ORDER BY start_time ASC", None: ""}
+
+def _queries(cols: str, order_by: Optional[str]) -> Tuple[str, str, str, str]:
+    """(all, by calendar, by range, by calendar + range) SQL for cols."""
+    return tuple(
+        select.format(cols=cols) + _ORDER_BY[order_by]
+        for select in (_SELECT_ALL, _SELECT_CAL, _SELECT_RANGE, _SELECT_CAL_RANGE)
+    )
+
+_Q_EVENTS = {order_by: _queries("event_json", order_by) for order_by in _ORDER_BY}
+
+_LITE_COLS = "summary, start_time, end_time, all_day, color"
+_Q_LITE = _queries(_LITE_COLS, "start")
+
+# Open bounds for half-specified ranges (ISO-8601 strings sort lexically)
+_MIN_TIME = ""
+_MAX_TIME = "9999-12-31T23:59:59"
+
+# Full resync after this long so events entering the fetch window are picked up
+SYNC_TOKEN_MAX_AGE = 24 * 60 * 60
+
+# Refresh planner statistics after writes larger than this
+ANALYZE_THRESHOLD = 200
+
+# Reclaim free pages at most this often (see CacheManager.maintenance)
+VACUUM_INTERVAL = 30 * 24 * 60 * 60
+
+# Lightweight event row read straight from the indexed columns
+Event = namedtuple("Event", ["summary", "start_time", "end_time", "all_day", "color"])
+
 class CacheManager:
     """Manages SQLite cache for calendar events."""
     
@@ -20,11 +74,102 @@ class CacheManager:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Single long-lived connection shared across calls (and threads)
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._conn = self._connect()
         self._init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a database connection with performance pragmas applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=67108864")
+        conn.execute("PRAGMA cache_size=-20000")
+        return conn
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Lock the connection; commit on success, roll back on error.
+        
+        Inside batch() the commit/rollback is left to the outermost batch.
+        """
+        with self._lock:
+            try:
+                yield self._conn
+            except BaseException:
+                if not self._batch_depth:
+                    self._conn.rollback()
+                raise
+            else:
+                if not self._batch_depth:
+                    self._conn.commit()
+    
+    @contextmanager
+    def batch(self) -> Iterator["CacheManager"]:
+        """Group writes (from any thread) into one transaction and one commit.
+        
+        Usage:
+            with cache.batch():
+                cache.store_events(...)
+                cache.store_events(...)
+        """
+        with self._lock:
+            if not self._batch_depth:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._batch_depth += 1
+        
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._conn.rollback()
+            raise
+        else:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._conn.commit()
+    
+    @contextmanager
+    def savepoint(self) -> Iterator["CacheManager"]:
+        """Make a group of writes all-or-nothing, even inside a batch().
+        
+        On error the group's writes are rolled back and the exception
+        propagates; the enclosing batch's other writes are kept.
+        
+        Usage:
+            with cache.batch():
+                for ...:
+                    with cache.savepoint():
+                        cache.delete_events(...)
+                        cache.store_events(...)
+        """
+        with self._lock:
+            self._conn.execute("SAVEPOINT cache_write")
+            # Counts as a batch level, so the writes inside don't commit early
+            self._batch_depth += 1
+        
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                self._batch_depth -= 1
+                self._conn.execute("ROLLBACK TO cache_write")
+                self._conn.execute("RELEASE cache_write")
+            raise
+        else:
+            with self._lock:
+                self._batch_depth -= 1
+                self._conn.execute("RELEASE cache_write")
+    
     def _init_db(self):
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
             # Events table
@@ -38,8 +183,8 @@ class CacheManager:
                     end_time TEXT NOT NULL,
                     all_day INTEGER DEFAULT 0,
                     color TEXT,
-                    event_json TEXT NOT NULL,
-                    cached_at TEXT NOT NULL,
+                    event_json BLOB NOT NULL,
+                    cached_at INTEGER NOT NULL,
                     UNIQUE(id, calendar_id)
                 )
             """)
@@ -49,7 +194,7 @@ class CacheManager:
                 CREATE TABLE IF NOT EXISTS cache_metadata (
                     key TEXT PRIMARY KEY,
                     value TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
+                    updated_at INTEGER NOT NULL
                 )
             """)
             
@@ -57,8 +202,11 @@ class CacheManager:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_calendar_id ON events(calendar_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_start_time ON events(start_time)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_cached_at ON events(cached_at)")
+            # Matches WHERE calendar_id = ? AND start_time >= ? ORDER BY start_time
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cal_start ON events(calendar_id, start_time)"
+            )
             
-            conn.commit()
             logger.info(f"Cache database initialized: {self.db_path}")
     
     def store_events(self, calendar_id: str, events: List[Dict]) -> int:
@@ -71,97 +219,227 @@ class CacheManager:
         Returns:
             Number of events stored
         """
-        now = datetime.utcnow().isoformat()
+        now = int(time.time())
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        rows = []
+        for event in events:
+            event_id = event.get("id", "")
+            if not event_id:
+                logger.warning(f"Skipping event without ID: {event.get('summary')}")
+                continue
             
-            count = 0
-            for event in events:
-                event_id = event.get("id", "")
-                if not event_id:
-                    logger.warning(f"Skipping event without ID: {event.get('summary')}")
-                    continue
+            try:
+                start = event.get("start") or {}
+                end = event.get("end") or {}
+                start_time = start.get("dateTime") or start.get("date")
+                end_time = end.get("dateTime") or end.get("date")
                 
-                try:
-                    start_time = event.get("start", {}).get("dateTime") or \
-                                 event.get("start", {}).get("date")
-                    end_time = event.get("end", {}).get("dateTime") or \
-                               event.get("end", {}).get("date")
-                    
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO events
-                        (id, calendar_id, summary, description, start_time, end_time,
-                         all_day, color, event_json, cached_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        event_id,
-                        calendar_id,
-                        event.get("summary", ""),
-                        event.get("description", ""),
-                        start_time,
-                        end_time,
-                        1 if "date" in event.get("start", {}) else 0,
-                        event.get("colorId", ""),
-                        json.dumps(event),
-                        now
-                    ))
-                    count += 1
-                except Exception as e:
-                    logger.error(f"Error storing event {event_id}: {e}")
+                rows.append((
+                    event_id,
+                    calendar_id,
+                    event.get("summary", ""),
+                    event.get("description", ""),
+                    start_time,
+                    end_time,
+                    1 if "date" in start else 0,
+                    event.get("colorId") or "",
+                    _dumps(event),
+                    now
+                ))
+            except Exception as e:
+                logger.error(f"Error storing event {event_id}: {e}")
+        
+        with self._transaction() as conn:
+            # One explicit transaction for the whole batch (unless in batch())
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            conn.executemany("""
+                INSERT OR REPLACE INTO events
+                (id, calendar_id, summary, description, start_time, end_time,
+                 all_day, color, event_json, cached_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
             
-            conn.commit()
+            count = len(rows)
             logger.info(f"Stored {count} events for calendar {calendar_id}")
             
+            if count > ANALYZE_THRESHOLD:
+                conn.execute("ANALYZE events")
+            
             # Update cache timestamp
-            self._set_metadata("last_update", now)
+            self._set_metadata("last_update", str(now))
         
         return count
     
+    def iter_events(self, calendar_id: Optional[str] = None,
+                    start_date: Optional[str] = None,
+                    end_date: Optional[str] = None,
+                    order_by: Optional[str] = "start") -> Iterator[Dict]:
+        """Stream events from cache, parsing each row lazily.
+        
+        The cache lock is held until the iterator is exhausted or closed.
+        
+        Args:
+            calendar_id: Filter by calendar (None = all)
+            start_date: Filter by start date (ISO format)
+            end_date: Filter by end date (ISO format)
+            order_by: "start" to order by start time, None for storage order
+            
+        Yields:
+            Event dictionaries
+        """
+        if order_by not in _ORDER_BY:
+            raise ValueError(f"Unsupported order_by: {order_by!r}")
+        
+        with self._lock:
+            cursor = self._query_events(
+                _Q_EVENTS[order_by], calendar_id, start_date, end_date
+            )
+            
+            for row in cursor:
+                try:
+                    yield _loads(row[0])
+                except json.JSONDecodeError as e:
+                    logger.error(f"Error parsing cached event JSON: {e}")
+    
     def get_events(self, calendar_id: Optional[str] = None,
                    start_date: Optional[str] = None,
-                   end_date: Optional[str] = None) -> List[Dict]:
+                   end_date: Optional[str] = None,
+                   order_by: Optional[str] = "start") -> List[Dict]:
         """Retrieve events from cache.
         
         Args:
             calendar_id: Filter by calendar (None = all)
             start_date: Filter by start date (ISO format)
             end_date: Filter by end date (ISO format)
+            order_by: "start" to order by start time, None for storage order
             
         Returns:
             List of event dictionaries
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            query = "SELECT event_json FROM events WHERE 1=1"
-            params = []
-            
-            if calendar_id:
-                query += " AND calendar_id = ?"
-                params.append(calendar_id)
+        return list(self.iter_events(calendar_id, start_date, end_date, order_by))
+    
+    def get_events_lite(self, calendar_id: Optional[str] = None,
+                        start_date: Optional[str] = None,
+                        end_date: Optional[str] = None) -> List[Event]:
+        """Retrieve display fields of cached events without JSON decoding.
+        
+        Args:
+            calendar_id: Filter by calendar (None = all)
+            start_date: Filter by start date (ISO format)
+            end_date: Filter by end date (ISO format)
             
-            if start_date:
-                query += " AND start_time >= ?"
-                params.append(start_date)
+        Returns:
+            List of Event tuples ordered by start time
+        """
+        with self._lock:
+            cursor = self._query_events(_Q_LITE, calendar_id, start_date, end_date)
+            return [Event._make(row) for row in cursor]
+    
+    def _query_events(self, queries: Tuple[str, str, str, str],
+                      calendar_id: Optional[str],
+                      start_date: Optional[str],
+                      end_date: Optional[str]) -> sqlite3.Cursor:
+        """Execute the query variant matching the given filters.
+        
+        Args:
+            queries: (all, by calendar, by range, by calendar + range) SQL
+            calendar_id: Filter by calendar (None = all)
+            start_date: Filter by start date (ISO format)
+            end_date: Filter by end date (ISO format)
             
-            if end_date:
-                query += " AND start_time <= ?"
-                params.append(end_date)
+        Returns:
+            Cursor over the matching rows
+        """
+        q_all, q_cal, q_range, q_cal_range = queries
+        has_range = bool(start_date or end_date)
+        bounds = (start_date or _MIN_TIME, end_date or _MAX_TIME)
+        
+        if calendar_id and has_range:
+            return self._conn.execute(q_cal_range, (calendar_id,) + bounds)
+        if calendar_id:
+            return self._conn.execute(q_cal, (calendar_id,))
+        if has_range:
+            return self._conn.execute(q_range, bounds)
+        return self._conn.execute(q_all)
+    
+    def delete_events(self, calendar_id: str, event_ids: List[str]) -> int:
+        """Delete specific events (e.g. cancelled ones reported by a sync).
+        
+        Args:
+            calendar_id: Calendar identifier
+            event_ids: IDs of events to delete
             
-            query += " ORDER BY start_time ASC"
+        Returns:
+            Number of events deleted
+        """
+        with self._transaction() as conn:
+            cursor = conn.executemany(
+                "DELETE FROM events WHERE id = ? AND calendar_id = ?",
+                [(event_id, calendar_id) for event_id in event_ids]
+            )
+            deleted = cursor.rowcount
+            logger.info(f"Deleted {deleted} events from calendar {calendar_id}")
             
-            cursor.execute(query, params)
-            events = []
+            return deleted
+    
+    def get_sync_token(self, calendar_id: str,
+                       max_age: int = SYNC_TOKEN_MAX_AGE) -> Optional[str]:
+        """Get the stored incremental sync token for a calendar.
+        
+        Args:
+            calendar_id: Calendar identifier
+            max_age: Ignore tokens older than this many seconds
             
-            for row in cursor.fetchall():
-                try:
-                    events.append(json.loads(row["event_json"]))
-                except json.JSONDecodeError as e:
-                    logger.error(f"Error parsing cached event JSON: {e}")
+        Returns:
+            Sync token, or None if missing or too old
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT value, updated_at FROM cache_metadata WHERE key = ?",
+                (f"sync_token:{calendar_id}",)
+            ).fetchone()
+        
+        if not row or not row[0]:
+            return None
+        
+        try:
+            age = int(time.time()) - int(row[1])
+        except ValueError as e:
+            # Rows written before timestamps became epoch seconds
+            logger.error(f"Error reading sync token age: {e}")
+            return None
+        
+        return row[0] if age < max_age else None
+    
+    def set_sync_token(self, calendar_id: str, token: Optional[str]):
+        """Store (or clear, with None) the incremental sync token for a calendar.
+        
+        Args:
+            calendar_id: Calendar identifier
+            token: nextSyncToken from the Calendar API
+        """
+        self._set_metadata(f"sync_token:{calendar_id}", token or "")
+    
+    def get_events_hash(self, calendar_id: str) -> Optional[str]:
+        """Get the content hash of the last events batch written for a calendar.
+        
+        Args:
+            calendar_id: Calendar identifier
             
-            return events
+        Returns:
+            Hex digest, or None if none stored
+        """
+        return self._get_metadata(f"last_events_hash:{calendar_id}")
+    
+    def set_events_hash(self, calendar_id: str, digest: str):
+        """Store the content hash of the events batch just written.
+        
+        Args:
+            calendar_id: Calendar identifier
+            digest: Hex digest from calendar_fetcher.events_hash
+        """
+        self._set_metadata(f"last_events_hash:{calendar_id}", digest)
     
     def clear_old_events(self, days: int = 7) -> int:
         """Clear events older than specified days.
@@ -172,20 +450,67 @@ class CacheManager:
         Returns:
             Number of events deleted
         """
-        with sqlite3.connect(self.db_path) as conn:
+        # ISO-8601 strings sort lexically, so a plain comparison can use idx_start_time
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%S")
+        
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                DELETE FROM events
-                WHERE datetime(start_time) < datetime('now', '-' || ? || ' days')
-            """, (days,))
+            cursor.execute("DELETE FROM events WHERE start_time < ?", (cutoff,))
             
             deleted = cursor.rowcount
-            conn.commit()
             logger.info(f"Cleared {deleted} old events")
             
             return deleted
     
+    def maintenance_due(self, vacuum_interval: int = VACUUM_INTERVAL) -> bool:
+        """Check whether vacuum_interval has passed since the last VACUUM.
+        
+        Args:
+            vacuum_interval: Minimum seconds between VACUUM runs
+            
+        Returns:
+            True if maintenance() would run now
+        """
+        last_vacuum = self._get_metadata("last_vacuum")
+        if not last_vacuum:
+            return True
+        
+        try:
+            return int(time.time()) - int(last_vacuum) >= vacuum_interval
+        except ValueError as e:
+            logger.error(f"Error reading last vacuum time: {e}")
+            return True
+    
+    def maintenance(self, vacuum_interval: int = VACUUM_INTERVAL) -> bool:
+        """Refresh planner statistics and VACUUM the database, at most once per interval.
+        
+        Args:
+            vacuum_interval: Minimum seconds between runs
+            
+        Returns:
+            True if VACUUM ran
+        """
+        with self._lock:
+            # VACUUM fails inside a transaction, e.g. a batch() open on another thread
+            if self._conn.in_transaction:
+                logger.warning("Cache busy, skipping maintenance")
+                return False
+            
+            if not self.maintenance_due(vacuum_interval):
+                return False
+            
+            self._conn.execute("ANALYZE")
+            self._conn.execute("VACUUM")
+            self._set_metadata("last_vacuum", str(int(time.time())))
+            logger.info("Cache database vacuumed")
+            
+            return True
+    
+    def mark_updated(self):
+        """Record a successful fetch, including one that changed no events."""
+        self._set_metadata("last_update", str(int(time.time())))
+    
     def get_cache_age(self) -> Optional[int]:
         """Get age of cache in seconds.
         
@@ -197,10 +522,8 @@ class CacheManager:
             return None
         
         try:
-            cache_time = datetime.fromisoformat(last_update)
-            age = (datetime.utcnow() - cache_time).total_seconds()
-            return int(age)
-        except Exception as e:
+            return int(time.time()) - int(last_update)
+        except ValueError as e:
             logger.error(f"Error calculating cache age: {e}")
             return None
     
@@ -213,7 +536,7 @@ class CacheManager:
         Returns:
             Number of events
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
             if calendar_id:
@@ -228,17 +551,16 @@ class CacheManager:
     
     def _set_metadata(self, key: str, value: str):
         """Store metadata."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO cache_metadata (key, value, updated_at)
                 VALUES (?, ?, ?)
-            """, (key, value, datetime.utcnow().isoformat()))
-            conn.commit()
+            """, (key, value, int(time.time())))
     
     def _get_metadata(self, key: str) -> Optional[str]:
         """Retrieve metadata."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT value FROM cache_metadata WHERE key = ?",
@@ -249,12 +571,16 @@ class CacheManager:
     
     def clear_all(self):
         """Clear all cached events."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM events")
             cursor.execute("DELETE FROM cache_metadata")
-            conn.commit()
             logger.info("Cache cleared")
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
 if __name__ == "__main__":
     # Test cache manager
@@ -1,45 +1,167 @@
 """Google Calendar API client with cache integration."""
 
+import asyncio
+import hashlib
+import json
 import logging
-import pickle
-from datetime import datetime, timedelta
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+from urllib.parse import quote, urlencode
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google.auth.exceptions import RefreshError
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import aiohttp
 
 from . import config
 from .cache_manager import CacheManager
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # stdlib fallback; json.loads also accepts bytes
+    orjson = None
+    _loads = json.loads
+
+# The Google client libraries take a noticeable time to import on a Pi, so
+# they are imported where first needed; offline (cache-only) runs skip them
+if TYPE_CHECKING:
+    from google.auth.transport.requests import AuthorizedSession
+    from google.oauth2.credentials import Credentials
+    from google_auth_httplib2 import AuthorizedHttp
+
 logger = logging.getLogger(__name__)
 
 # Google Calendar API scopes
 SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
 
+# Google Calendar REST endpoints for listing a calendar's events
+API_ROOT = "https://www.googleapis.com"
+EVENTS_PATH = "/calendar/v3/calendars/{calendar_id}/events"
+EVENTS_URL = API_ROOT + EVENTS_PATH
+BATCH_URL = API_ROOT + "/batch/calendar/v3"
+BATCH_BOUNDARY = "batch_epaper_calendar"
+
+# Socket timeout for Calendar API requests (seconds)
+HTTP_TIMEOUT = 30
+
+# Refresh a still-valid token in the background when it expires within this
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Shared pool for fetching calendars in parallel (avoids per-call thread startup)
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="calendar-fetch")
+
+# Partial-response mask: only the event fields the cache and renderers use,
+# plus the status (to spot cancellations in incremental syncs), the
+# last-modified time (to spot unchanged pages), the parent of recurring
+# instances and paging/sync tokens. Applies to the batch requests too.
+EVENT_FIELDS = (
+    "items(id,status,updated,summary,description,start,end,colorId,recurringEventId),"
+    "nextPageToken,nextSyncToken"
+)
+
+@lru_cache(maxsize=8)
+def _window_for_minute(minute: int, days: int) -> Tuple[str, str]:
+    start = datetime.fromtimestamp(minute * 60, timezone.utc)
+    end = start + timedelta(days=days)
+    return (start.isoformat().replace("+00:00", "Z"),
+            end.isoformat().replace("+00:00", "Z"))
+
+def _time_window(days: int) -> Tuple[str, str]:
+    """RFC 3339 UTC (start, end) strings from now to `days` ahead.
+    
+    Memoized per minute, so back-to-back calls (e.g. one per calendar)
+    share the same strings.
+    """
+    return _window_for_minute(int(time.time() // 60), days)
+
+def _rest_query(params: Dict) -> Dict:
+    """events.list parameters encoded for a raw REST query string."""
+    return {k: str(v).lower() if isinstance(v, bool) else v for k, v in params.items()}
+
+def _http_status(error: Exception) -> Optional[int]:
+    """HTTP status of a googleapiclient or requests HTTP error."""
+    if hasattr(error, "resp"):
+        return error.resp.status
+    response = getattr(error, "response", None)
+    return response.status_code if response is not None else None
+
+def events_hash(events: List[Dict]) -> str:
+    """Cheap content hash of an events page, from each event's ID and update time."""
+    payload = json.dumps(
+        [(e.get("id", ""), e.get("updated", ""), e.get("status", "")) for e in events],
+        separators=(",", ":")
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+def load_credentials(token_path: Path) -> Optional["Credentials"]:
+    """Load OAuth credentials from a JSON token file.
+    
+    Args:
+        token_path: Path to token.json
+        
+    Returns:
+        Credentials, or None if the file is missing or not JSON
+    """
+    if not token_path.exists():
+        return None
+    
+    try:
+        with open(token_path, "rb") as token_file:
+            info = json.loads(token_file.read())
+    except ValueError:
+        # Tokens written by older versions were pickled Credentials objects
+        logger.error(f"{token_path} is not a JSON token; "
+                     f"run 'python scripts/setup_oauth.py --generate' to recreate it")
+        return None
+    
+    from google.oauth2.credentials import Credentials
+    return Credentials.from_authorized_user_info(info, SCOPES)
+
+def save_credentials(token_path: Path, creds: "Credentials"):
+    """Write OAuth credentials to a JSON token file.
+    
+    Args:
+        token_path: Path to token.json
+        creds: Credentials to save
+    """
+    # Write to a temp file and rename, so a crash never leaves a torn token
+    tmp_path = token_path.with_name(token_path.name + ".tmp")
+    with open(tmp_path, "w") as token_file:
+        token_file.write(creds.to_json())
+    os.replace(tmp_path, token_path)
+
 class CalendarFetcher:
     """Fetches events from Google Calendar with caching."""
     
-    def __init__(self, credentials_path: str, token_path: str, cache_manager: CacheManager):
+    def __init__(self, credentials_path: str, token_path: str, cache_manager: CacheManager,
+                 credentials: Optional["Credentials"] = None):
         """Initialize calendar fetcher.
         
         Args:
             credentials_path: Path to OAuth credentials.json
             token_path: Path to token.json (created after OAuth)
             cache_manager: CacheManager instance for offline support
+            credentials: Already-loaded credentials (skips reading token_path)
         """
         self.credentials_path = Path(credentials_path)
         self.token_path = Path(token_path)
         self.cache = cache_manager
+        self.credentials = credentials
         self.service = None
+        self._events_list = None
         self.last_error = None
+        # httplib2.Http is not thread-safe, so each worker thread gets its own
+        self._local = threading.local()
         
         try:
             self.service = self._get_service()
+            # Bound once; each call still creates a fresh HttpRequest
+            self._events_list = self.service.events().list
         except Exception as e:
             logger.error(f"Failed to initialize Google Calendar service: {e}")
             self.last_error = str(e)
@@ -53,21 +175,27 @@ class CalendarFetcher:
         Raises:
             Exception if authentication fails
         """
-        creds = None
+        from google.auth.exceptions import RefreshError
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+        
+        creds = self.credentials
         
         # Load existing token
-        if self.token_path.exists():
+        if creds is None:
             try:
-                with open(self.token_path, "rb") as token_file:
-                    creds = pickle.load(token_file)
-                logger.info("Loaded existing token")
+                creds = load_credentials(self.token_path)
+                if creds:
+                    logger.info("Loaded existing token")
             except Exception as e:
                 logger.warning(f"Failed to load token: {e}")
         
         # Refresh or create new token
+        refreshed = False
         if creds and creds.expired and creds.refresh_token:
             try:
                 creds.refresh(Request())
+                refreshed = True
                 logger.info("Refreshed OAuth token")
             except RefreshError as e:
                 logger.error(f"Token refresh failed: {e}")
@@ -76,61 +204,275 @@ class CalendarFetcher:
             raise RuntimeError(
                 "No valid credentials. Run setup_oauth.py to generate token.json"
             )
+        elif creds.refresh_token and creds.expiry and (
+                creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None)
+                < TOKEN_REFRESH_MARGIN):
+            # Still valid: keep using it for the pending requests while a worker
+            # refreshes it in place (AuthorizedHttp picks up the new token)
+            _EXECUTOR.submit(self._refresh_in_background, creds)
+        
+        # Save token (only changes on refresh)
+        if refreshed:
+            save_credentials(self.token_path, creds)
+        self.credentials = creds
         
-        # Save token
-        with open(self.token_path, "wb") as token_file:
-            pickle.dump(creds, token_file)
+        # Build on this thread's keep-alive transport so the service and
+        # the batch/paged requests made from here share one TLS connection
+        self._local.http = None
+        self._local.session = None
+        # Bundled discovery document: no network fetch or file cache lookup
+        return build("calendar", "v3", http=self._thread_http(),
+                     static_discovery=True, cache_discovery=False)
+    
+    def _refresh_in_background(self, creds: "Credentials"):
+        """Refresh credentials ahead of expiry and save them (worker thread)."""
+        from google.auth.transport.requests import Request
         
-        return build("calendar", "v3", credentials=creds)
+        try:
+            creds.refresh(Request())
+            save_credentials(self.token_path, creds)
+            logger.info("Refreshed OAuth token ahead of expiry")
+        except Exception as e:
+            # Not fatal: the transport refreshes on 401 once the token expires
+            logger.warning(f"Background token refresh failed: {e}")
     
-    def fetch_events(self, calendar_id: str, days: int = 42) -> Tuple[List[Dict], bool]:
+    def fetch_events(self, calendar_id: str, days: int = 42,
+                     params: Optional[Dict] = None,
+                     first_page: Optional[Dict] = None) -> Tuple[List[Dict], bool]:
         """Fetch events from calendar.
         
+        Uses an incremental sync (only changes since the last fetch) when a
+        sync token is cached, otherwise a full paged fetch of the window.
+        
         Args:
             calendar_id: Google Calendar ID
             days: Number of days to fetch (default: 42 for 6 weeks)
+            params: Query parameters first_page was requested with
+            first_page: Already-fetched first page (e.g. from a batch request)
             
         Returns:
             Tuple of (events list, success flag)
         """
-        now = datetime.utcnow().isoformat() + "Z"
-        end_date = (datetime.utcnow() + timedelta(days=days)).isoformat() + "Z"
+        changes = self._download(calendar_id, days, params, first_page)
+        stored = changes is not None and self._store_changes({calendar_id: changes})[calendar_id]
+        return self._fetch_result(calendar_id, days, stored)
+    
+    def _download(self, calendar_id: str, days: int = 42,
+                  params: Optional[Dict] = None,
+                  first_page: Optional[Dict] = None
+                  ) -> Optional[Tuple[List[Dict], Optional[str]]]:
+        """Download a calendar's changes without writing them to the cache.
         
-        try:
-            if not self.service:
-                logger.warning("Service not initialized, using cache")
-                return self.cache.get_events(calendar_id), False
-            
-            events_result = self.service.events().list(
-                calendarId=calendar_id,
-                timeMin=now,
-                timeMax=end_date,
-                singleEvents=True,
-                orderBy="startTime",
-                maxResults=250
-            ).execute()
-            
-            events = events_result.get("items", [])
-            logger.info(f"Fetched {len(events)} events from {calendar_id}")
-            
-            # Store in cache
-            self.cache.store_events(calendar_id, events)
+        Args:
+            calendar_id: Google Calendar ID
+            days: Number of days to fetch on a full sync
+            params: Query parameters first_page was requested with
+            first_page: Already-fetched first page (e.g. from a batch request)
             
-            return events, True
+        Returns:
+            (events, next sync token), or None if the fetch failed
+        """
+        if not self.service:
+            logger.warning("Service not initialized, using cache")
+            return None
+        
+        from googleapiclient.errors import HttpError
+        from requests import HTTPError
+        
+        try:
+            try:
+                return self._sync_events(calendar_id, days, params, first_page)
+            except (HttpError, HTTPError) as e:
+                if _http_status(e) != 410:
+                    raise
+                # Sync token expired server-side: fall back to a full sync
+                logger.info(f"Sync token for {calendar_id} expired, doing full sync")
+                self.cache.set_sync_token(calendar_id, None)
+                return self._sync_events(calendar_id, days)
             
-        except HttpError as e:
+        except (HttpError, HTTPError) as e:
             logger.error(f"Calendar API error: {e}")
             self.last_error = str(e)
-            # Return cached events
-            return self.cache.get_events(calendar_id), False
+            return None
         except Exception as e:
             logger.error(f"Unexpected error fetching events: {e}")
             self.last_error = str(e)
-            return self.cache.get_events(calendar_id), False
+            return None
+    
+    def _sync_events(self, calendar_id: str, days: int,
+                     params: Optional[Dict] = None,
+                     first_page: Optional[Dict] = None
+                     ) -> Tuple[List[Dict], Optional[str]]:
+        """Page through events.list and collect every page's events.
+        
+        Pages are requested straight from the REST endpoint over a pooled
+        AuthorizedSession, skipping googleapiclient's request building.
+        
+        Args:
+            calendar_id: Google Calendar ID
+            days: Number of days to fetch on a full sync
+            params: Query parameters first_page was requested with
+            first_page: Already-fetched first page, if any
+            
+        Returns:
+            (events, next sync token)
+        """
+        if params is None:
+            params = self._list_params(calendar_id, days)
+        query = _rest_query(params)
+        url = EVENTS_URL.format(calendar_id=quote(calendar_id, safe=""))
+        session = self._thread_session()
+        events_result = first_page
+        items = []
+        
+        while True:
+            if events_result is None:
+                response = session.get(url, params=query, timeout=HTTP_TIMEOUT)
+                response.raise_for_status()
+                events_result = _loads(response.content)
+            
+            items.extend(events_result.get("items", []))
+            
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                break
+            query = dict(query, pageToken=page_token)
+            events_result = None
+        
+        return items, events_result.get("nextSyncToken")
+    
+    def _thread_session(self) -> "AuthorizedSession":
+        """Get this thread's pooled requests session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            from google.auth.transport.requests import AuthorizedSession
+            
+            session = self._local.session = AuthorizedSession(self.credentials)
+        return session
+    
+    def _thread_http(self) -> "AuthorizedHttp":
+        """Get this thread's authorized keep-alive transport, creating it on first use."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+            self._local.http = http
+        return http
+    
+    def _list_params(self, calendar_id: str, days: int) -> Dict:
+        """Build events.list parameters for a full or incremental sync.
+        
+        Args:
+            calendar_id: Google Calendar ID
+            days: Number of days to fetch on a full sync
+            
+        Returns:
+            Query parameters (excluding calendarId and pageToken)
+        """
+        params = {
+            "singleEvents": True,
+            "maxResults": 250,
+            "fields": EVENT_FIELDS,
+        }
+        
+        sync_token = self.cache.get_sync_token(calendar_id)
+        if sync_token:
+            # timeMin/timeMax/orderBy are not allowed together with syncToken
+            params["syncToken"] = sync_token
+        else:
+            params["timeMin"], params["timeMax"] = _time_window(days)
+        
+        return params
+    
+    def _apply_changes(self, calendar_id: str, events: List[Dict]):
+        """Store fetched events and drop the ones reported as cancelled.
+        
+        Args:
+            calendar_id: Google Calendar ID
+            events: Events from every events.list page of one fetch
+        """
+        if not events:
+            return
+        
+        # Skip the SQLite write (and its fsync) when this fetch matches the last one
+        digest = events_hash(events)
+        if digest == self.cache.get_events_hash(calendar_id):
+            logger.info(f"Events unchanged for {calendar_id}, skipping cache write")
+            return
+        
+        cancelled = [e["id"] for e in events if e.get("status") == "cancelled"]
+        if cancelled:
+            self.cache.delete_events(calendar_id, cancelled)
+        
+        active = [e for e in events if e.get("status") != "cancelled"]
+        logger.info(f"Fetched {len(active)} events from {calendar_id}")
+        self.cache.store_events(calendar_id, active)
+        self.cache.set_events_hash(calendar_id, digest)
+    
+    def _store_changes(self, changes: Dict[str, Tuple[List[Dict], Optional[str]]]
+                       ) -> Dict[str, bool]:
+        """Write downloaded changes for several calendars in one transaction.
+        
+        Each calendar's writes are all-or-nothing within it.
+        
+        Args:
+            changes: {calendar ID: (events, next sync token)}, as _download returns
+            
+        Returns:
+            {calendar ID: whether its changes were stored}
+        """
+        stored = {}
+        with self.cache.batch():
+            for calendar_id, (events, sync_token) in changes.items():
+                try:
+                    # A calendar that fails leaves none of its writes behind
+                    with self.cache.savepoint():
+                        self._apply_changes(calendar_id, events)
+                        # An unchanged token needs no write either
+                        if sync_token and sync_token != self.cache.get_sync_token(calendar_id):
+                            self.cache.set_sync_token(calendar_id, sync_token)
+                    stored[calendar_id] = True
+                except Exception as e:
+                    logger.error(f"Unexpected error storing events: {e}")
+                    self.last_error = str(e)
+                    stored[calendar_id] = False
+            
+            # Unchanged events skip store_events, so refresh the cache age here
+            if any(stored.values()):
+                self.cache.mark_updated()
+        return stored
+    
+    def _fetch_result(self, calendar_id: str, days: int, stored: bool) -> Tuple[List[Dict], bool]:
+        """A calendar's (events, success) pair: its display window once stored, else all cached."""
+        if stored:
+            return self._cached_window(calendar_id, days), True
+        return self.cache.get_events(calendar_id), False
+    
+    def _cached_window(self, calendar_id: str, days: int) -> List[Dict]:
+        """Get the display window (today through `days` ahead) from cache.
+        
+        Args:
+            calendar_id: Google Calendar ID
+            days: Number of days ahead
+            
+        Returns:
+            Events ordered by start time
+        """
+        now = datetime.now(timezone.utc)
+        return self.cache.get_events(
+            calendar_id,
+            start_date=now.date().isoformat(),
+            end_date=_time_window(days)[1]
+        )
     
     def fetch_all_calendars(self) -> Tuple[Dict[str, List[Dict]], Dict[str, bool]]:
         """Fetch events from all configured calendars.
         
+        First pages come back from a single batch request; any further pages
+        (and calendars whose batch part failed) are fetched in parallel.
+        
         Returns:
             Tuple of (events dict, success dict)
             - events: {calendar_id: [events]}
@@ -138,25 +480,318 @@ class CalendarFetcher:
         """
         events = {}
         success = {}
+        configured = []
         
-        calendars = [
-            ("ashi", config.ASHI_CALENDAR_ID),
-            ("sindi", config.SINDI_CALENDAR_ID)
-        ]
+        for name, calendar_id in self._calendars():
+            if not calendar_id:
+                logger.warning(f"No calendar ID configured for {name}")
+                events[name] = []
+                success[name] = False
+                continue
+            configured.append((name, calendar_id))
+        
+        first_pages = self._batch_first_pages(configured) if self.service else {}
+        
+        futures = {}
+        for name, calendar_id in configured:
+            params, page = first_pages.get(name, (None, None))
+            futures[calendar_id] = _EXECUTOR.submit(self._download, calendar_id,
+                                                    params=params, first_page=page)
+        downloaded = {cid: future.result() for cid, future in futures.items()}
+        
+        # Network I/O is done: take the write lock only for one transaction
+        # (and one WAL commit) covering every calendar's writes
+        stored = self._store_changes(
+            {cid: changes for cid, changes in downloaded.items() if changes is not None}
+        )
         
+        for name, calendar_id in configured:
+            events[name], success[name] = self._fetch_result(
+                calendar_id, 42, stored.get(calendar_id, False)
+            )
+        
+        return events, success
+    
+    def _batch_first_pages(self, calendars: List[Tuple[str, str]]
+                           ) -> Dict[str, Tuple[Dict, Dict]]:
+        """Request the first events page of several calendars in one batch call.
+        
+        Args:
+            calendars: (name, calendar ID) per calendar
+            
+        Returns:
+            {name: (query parameters, first page)} for the parts that succeeded
+        """
+        from googleapiclient.errors import HttpError
+        
+        pages = {}
+        params = {name: self._list_params(cid, 42) for name, cid in calendars}
+        
+        def on_response(request_id, response, exception):
+            if exception is None:
+                pages[request_id] = (params[request_id], response)
+            elif isinstance(exception, HttpError) and exception.resp.status == 410:
+                calendar_id = dict(calendars)[request_id]
+                logger.info(f"Sync token for {calendar_id} expired, doing full sync")
+                self.cache.set_sync_token(calendar_id, None)
+            else:
+                logger.warning(f"Batch part for {request_id} failed: {exception}")
+        
+        batch = self.service.new_batch_http_request(callback=on_response)
         for name, calendar_id in calendars:
+            batch.add(
+                self._events_list(calendarId=calendar_id, **params[name]),
+                request_id=name
+            )
+        
+        try:
+            batch.execute(http=self._thread_http())
+        except Exception as e:
+            logger.warning(f"Batch request failed, fetching calendars individually: {e}")
+            return {}
+        
+        return pages
+    
+    async def fetch_events_async(self, session: aiohttp.ClientSession, access_token: str,
+                                 calendar_id: str, days: int = 42,
+                                 params: Optional[Dict] = None,
+                                 first_page: Optional[Dict] = None) -> Tuple[List[Dict], bool]:
+        """Fetch events from calendar over the Calendar REST API.
+        
+        Same full/incremental sync behaviour as fetch_events.
+        
+        Args:
+            session: Shared aiohttp session (keeps connections alive across polls)
+            access_token: OAuth access token
+            calendar_id: Google Calendar ID
+            days: Number of days to fetch (default: 42 for 6 weeks)
+            params: Query parameters first_page was requested with
+            first_page: Already-fetched first page (e.g. from a batch request)
+            
+        Returns:
+            Tuple of (events list, success flag)
+        """
+        changes = await self._download_async(session, access_token, calendar_id, days,
+                                             params, first_page)
+        stored = changes is not None and (
+            await asyncio.to_thread(self._store_changes, {calendar_id: changes})
+        )[calendar_id]
+        return await asyncio.to_thread(self._fetch_result, calendar_id, days, stored)
+    
+    async def _download_async(self, session: aiohttp.ClientSession, access_token: str,
+                              calendar_id: str, days: int = 42,
+                              params: Optional[Dict] = None,
+                              first_page: Optional[Dict] = None
+                              ) -> Optional[Tuple[List[Dict], Optional[str]]]:
+        """Download a calendar's changes without writing them, as _download.
+        
+        Args:
+            session: Shared aiohttp session
+            access_token: OAuth access token
+            calendar_id: Google Calendar ID
+            days: Number of days to fetch on a full sync
+            params: Query parameters first_page was requested with
+            first_page: Already-fetched first page (e.g. from a batch request)
+            
+        Returns:
+            (events, next sync token), or None if the fetch failed
+        """
+        try:
+            try:
+                return await self._sync_events_async(session, access_token, calendar_id,
+                                                     days, params, first_page)
+            except aiohttp.ClientResponseError as e:
+                if e.status != 410:
+                    raise
+                logger.info(f"Sync token for {calendar_id} expired, doing full sync")
+                await asyncio.to_thread(self.cache.set_sync_token, calendar_id, None)
+                return await self._sync_events_async(session, access_token, calendar_id, days)
+            
+        except aiohttp.ClientError as e:
+            logger.error(f"Calendar API error: {e}")
+            self.last_error = str(e)
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error fetching events: {e}")
+            self.last_error = str(e)
+            return None
+    
+    async def _sync_events_async(self, session: aiohttp.ClientSession, access_token: str,
+                                 calendar_id: str, days: int,
+                                 params: Optional[Dict] = None,
+                                 first_page: Optional[Dict] = None
+                                 ) -> Tuple[List[Dict], Optional[str]]:
+        """Page through the REST events list and collect every page's events.
+        
+        Args:
+            session: Shared aiohttp session
+            access_token: OAuth access token
+            calendar_id: Google Calendar ID
+            days: Number of days to fetch on a full sync
+            params: Query parameters first_page was requested with
+            first_page: Already-fetched first page, if any
+            
+        Returns:
+            (events, next sync token)
+        """
+        url = EVENTS_URL.format(calendar_id=quote(calendar_id, safe=""))
+        headers = {"Authorization": f"Bearer {access_token}"}
+        
+        if params is None:
+            params = await asyncio.to_thread(self._rest_params, calendar_id, days)
+        events_result = first_page
+        items = []
+        
+        while True:
+            if events_result is None:
+                async with session.get(url, params=params, headers=headers) as response:
+                    response.raise_for_status()
+                    events_result = await response.json()
+            
+            items.extend(events_result.get("items", []))
+            
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                break
+            params = dict(params, pageToken=page_token)
+            events_result = None
+        
+        return items, events_result.get("nextSyncToken")
+    
+    def _rest_params(self, calendar_id: str, days: int) -> Dict:
+        """events.list parameters encoded for a raw REST query string."""
+        return _rest_query(self._list_params(calendar_id, days))
+    
+    async def _batch_first_pages_async(self, session: aiohttp.ClientSession, access_token: str,
+                                 requests: List[Tuple[str, Dict]]
+                                 ) -> List[Tuple[int, Optional[Dict]]]:
+        """Request the first events page of several calendars in one batch call.
+        
+        Args:
+            session: Shared aiohttp session
+            access_token: OAuth access token (applies to every inner request)
+            requests: (calendar ID, query parameters) per calendar
+            
+        Returns:
+            (HTTP status, parsed body or None) per request, in request order
+        """
+        parts = []
+        for i, (calendar_id, params) in enumerate(requests):
+            path = EVENTS_PATH.format(calendar_id=quote(calendar_id, safe=""))
+            parts.append(
+                f"--{BATCH_BOUNDARY}\r\n"
+                f"Content-Type: application/http\r\n"
+                f"Content-ID: <item{i}>\r\n\r\n"
+                f"GET {path}?{urlencode(params)}\r\n"
+            )
+        body = "\r\n".join(parts) + f"\r\n--{BATCH_BOUNDARY}--\r\n"
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": f"multipart/mixed; boundary={BATCH_BOUNDARY}",
+        }
+        
+        results = {}
+        async with session.post(BATCH_URL, data=body, headers=headers) as response:
+            response.raise_for_status()
+            reader = aiohttp.MultipartReader(response.headers, response.content)
+            while True:
+                part = await reader.next()
+                if part is None:
+                    break
+                
+                # Each part wraps a full HTTP response: status line, headers, body
+                raw = (await part.read()).decode("utf-8")
+                status_line, _, rest = raw.partition("\r\n")
+                _, _, payload = rest.partition("\r\n\r\n")
+                status = int(status_line.split()[1])
+                results[part.headers.get("Content-ID", "")] = (
+                    status, json.loads(payload) if status == 200 else None
+                )
+        
+        return [results.get(f"<response-item{i}>", (0, None)) for i in range(len(requests))]
+    
+    async def fetch_all_calendars_async(self, session: aiohttp.ClientSession,
+                                        access_token: str
+                                        ) -> Tuple[Dict[str, List[Dict]], Dict[str, bool]]:
+        """Fetch events from all configured calendars in one batch request.
+        
+        First pages come back from a single batch call; any further pages
+        (and calendars whose batch part failed) are fetched concurrently.
+        
+        Args:
+            session: Shared aiohttp session
+            access_token: OAuth access token
+            
+        Returns:
+            Tuple of (events dict, success dict), as fetch_all_calendars
+        """
+        events = {}
+        success = {}
+        
+        configured = []
+        for name, calendar_id in self._calendars():
             if not calendar_id:
                 logger.warning(f"No calendar ID configured for {name}")
                 events[name] = []
                 success[name] = False
                 continue
-            
-            calendar_events, is_success = self.fetch_events(calendar_id)
+            configured.append((name, calendar_id))
+        
+        requests = await asyncio.to_thread(
+            lambda: [(cid, self._rest_params(cid, 42)) for _, cid in configured]
+        )
+        
+        try:
+            first_pages = await self._batch_first_pages_async(session, access_token, requests)
+        except (aiohttp.ClientError, ValueError, IndexError) as e:
+            logger.warning(f"Batch request failed, fetching calendars individually: {e}")
+            first_pages = [(0, None)] * len(requests)
+        
+        fetches = []
+        for (calendar_id, params), (status, page) in zip(requests, first_pages):
+            if status == 410:
+                logger.info(f"Sync token for {calendar_id} expired, doing full sync")
+                await asyncio.to_thread(self.cache.set_sync_token, calendar_id, None)
+            if page is None:
+                fetches.append(self._download_async(session, access_token, calendar_id))
+            else:
+                fetches.append(self._download_async(session, access_token, calendar_id,
+                                                    params=params, first_page=page))
+        downloaded = await asyncio.gather(*fetches)
+        
+        # As fetch_all_calendars: one write transaction, opened after the network I/O
+        stored = await asyncio.to_thread(self._store_changes, {
+            cid: changes for (_, cid), changes in zip(configured, downloaded)
+            if changes is not None
+        })
+        
+        def results():
+            return [self._fetch_result(cid, 42, stored.get(cid, False)) for _, cid in configured]
+        
+        for (name, _), (calendar_events, is_success) in zip(configured, await asyncio.to_thread(results)):
             events[name] = calendar_events
             success[name] = is_success
         
         return events, success
     
+    def get_cached_calendars(self) -> Dict[str, List[Dict]]:
+        """Get cached events for all configured calendars.
+        
+        Returns:
+            Events dict keyed by calendar name
+        """
+        return {
+            name: self.cache.get_events(calendar_id) if calendar_id else []
+            for name, calendar_id in self._calendars()
+        }
+    
+    def _calendars(self) -> List[Tuple[str, str]]:
+        """Configured (name, calendar ID) pairs."""
+        return [
+            ("ashi", config.ASHI_CALENDAR_ID),
+            ("sindi", config.SINDI_CALENDAR_ID)
+        ]
+    
     def get_events_for_range(self, start_date: str, end_date: str,
                             calendar_id: Optional[str] = None) -> List[Dict]:
         """Get events for date range from cache.
@@ -188,18 +823,21 @@ class CalendarFetcher:
         start = datetime.combine(today, datetime.min.time()).isoformat()
         end = datetime.combine(today + timedelta(days=1), datetime.min.time()).isoformat()
         
-        events = self.cache.get_events(
+        return self.cache.get_events(
             calendar_id=calendar_id,
             start_date=start,
-            end_date=end
+            end_date=end,
+            order_by="start"
         )
-        
-        return sorted(events, key=lambda e: e.get("start", {}).get("dateTime", ""))
     
     def get_upcoming_events(self, limit: int = 3,
                            calendar_id: Optional[str] = None) -> List[Dict]:
         """Get upcoming events.
         
+        Reads the cache, unless a single calendar is requested while online
+        and the cache is older than the update interval; then only the first
+        `limit` events are requested from the API.
+        
         Args:
             limit: Maximum number of events to return
             calendar_id: Filter by calendar (None = all)
@@ -207,19 +845,52 @@ class CalendarFetcher:
         Returns:
             List of upcoming events (next N days)
         """
-        now = datetime.utcnow().isoformat()
-        end = (datetime.utcnow() + timedelta(days=7)).isoformat()
+        now, end = _time_window(7)
         
-        events = self.cache.get_events(
+        if calendar_id and self.service:
+            cache_age = self.cache.get_cache_age()
+            if cache_age is None or cache_age > config.UPDATE_INTERVAL:
+                try:
+                    return self._fetch_upcoming(calendar_id, limit, now, end)
+                except Exception as e:
+                    logger.warning(f"Upcoming events request failed, using cache: {e}")
+        
+        # Rows arrive in start order, so stop reading after the first `limit`
+        events = self.cache.iter_events(
             calendar_id=calendar_id,
             start_date=now,
-            end_date=end
+            end_date=end,
+            order_by="start"
         )
+        try:
+            return list(islice(events, limit))
+        finally:
+            events.close()
+    
+    def _fetch_upcoming(self, calendar_id: str, max_results: int,
+                        time_min: str, time_max: str) -> List[Dict]:
+        """Request just the next `max_results` events, sorted server-side.
+        
+        Args:
+            calendar_id: Google Calendar ID
+            max_results: Number of events to return
+            time_min: Window start (RFC 3339)
+            time_max: Window end (RFC 3339)
+            
+        Returns:
+            Events ordered by start time (id, updated, summary, start and end only)
+        """
+        events_result = self._events_list(
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=True,
+            orderBy="startTime",
+            maxResults=max_results,
+            fields="items(id,updated,summary,start,end)"
+        ).execute(http=self._thread_http())
         
-        return sorted(
-            events,
-            key=lambda e: e.get("start", {}).get("dateTime", "")
-        )[:limit]
+        return events_result.get("items", [])
     
     def is_online(self) -> bool:
         """Check if calendar API is accessible.
@@ -2,6 +2,7 @@
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -40,7 +41,8 @@ WAVESHARE_DC_PIN = int(os.getenv("WAVESHARE_DC_PIN", "25"))
 WAVESHARE_RST_PIN = int(os.getenv("WAVESHARE_RST_PIN", "27"))
 WAVESHARE_BUSY_PIN = int(os.getenv("WAVESHARE_BUSY_PIN", "17"))
 
-# Validate critical config
+# Validate critical config (settings are fixed at import, so once is enough)
+@lru_cache(maxsize=1)
 def validate_config():
     """Validate critical configuration."""
     if not ASHI_CALENDAR_ID:
@@ -50,8 +52,9 @@ def validate_config():
     return True
 
 # Setup logging
+@lru_cache(maxsize=1)
 def setup_logging():
-    """Configure logging."""
+    """Configure logging (idempotent; call from entry points, not at import)."""
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
     handlers = [logging.StreamHandler()]
@@ -72,9 +75,10 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
+    setup_logging()
     print(f"Config Base Dir: {BASE_DIR}")
     print(f"Credentials: {CREDENTIALS_PATH}")
     print(f"Token: {TOKEN_PATH}")
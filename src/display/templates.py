@@ -1,8 +1,10 @@
 """
 Display templates for different layouts and display modes.
 """
+import hashlib
+import json
 import logging
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 
@@ -11,6 +13,33 @@ from src.providers.base import WeatherData
 
 logger = logging.getLogger(__name__)
 
+HELVETICA = "/System/Library/Fonts/Helvetica.ttc"
+DEJAVU = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+DEJAVU_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+# Palette for red-mode frames: index 0 white, 1 black, 2 red (padded to 256 entries)
+RED_PALETTE = [255, 255, 255, 0, 0, 0, 255, 0, 0] + [0, 0, 0] * 253
+
+# Loaded fonts shared by every template instance, keyed by (paths, size)
+_FONT_CACHE: Dict[Tuple[Tuple[str, ...], int], ImageFont.ImageFont] = {}
+
+
+def _get_font(paths: Tuple[str, ...], size: int) -> ImageFont.ImageFont:
+    """Load the first available font in paths at size, caching the result."""
+    key = (paths, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        for path in paths:
+            try:
+                font = ImageFont.truetype(path, size)
+                break
+            except (OSError, AttributeError):
+                continue
+        else:
+            font = ImageFont.load_default()
+        _FONT_CACHE[key] = font
+    return font
+
 
 class DisplayTemplate:
     """Base class for display templates."""
@@ -20,13 +49,51 @@ class DisplayTemplate:
         self.width = width
         self.height = height
         self.color_mode = color_mode
-        self.black = 0 if color_mode == "bw" else (0, 0, 0)
-        self.white = 1 if color_mode == "bw" else (255, 255, 255)
+        if color_mode == "red":
+            # Palette indexes into RED_PALETTE (1 byte per pixel instead of 3)
+            self.white, self.black, self.red = 0, 1, 2
+        else:
+            self.black = 0 if color_mode == "bw" else (0, 0, 0)
+            self.white = 1 if color_mode == "bw" else (255, 255, 255)
+            self.red = self.black
+        # Value that clears the canvas to white in its own image mode
+        self._paper = self.white if color_mode in ("red", "bw") else 1
+        self._canvas: Optional[Image.Image] = None
+        self._bullets: Dict[ImageFont.ImageFont, Tuple[Image.Image, int]] = {}
 
     def render(self, events: List[Dict], weather: Optional[WeatherData] = None) -> Image.Image:
         """Render display. Must be implemented by subclass."""
         raise NotImplementedError
 
+    def _blank_canvas(self) -> Image.Image:
+        """Get the template's scratch canvas, cleared to white.
+
+        The same image is reused (and overwritten) by every render; callers
+        that keep a frame across renders should copy it.
+        """
+        if self._canvas is None:
+            if self.color_mode == "red":
+                self._canvas = Image.new("P", (self.width, self.height), self.white)
+                self._canvas.putpalette(RED_PALETTE)
+            else:
+                self._canvas = Image.new("1", (self.width, self.height), 1)
+        else:
+            self._canvas.paste(self._paper, (0, 0, self.width, self.height))
+        return self._canvas
+
+    def _bullet(self, font: ImageFont.ImageFont) -> Tuple[Image.Image, int]:
+        """Get a pre-rendered "• " sprite for font and its advance width."""
+        bullet = self._bullets.get(font)
+        if bullet is None:
+            width = int(font.getlength("• ") + 0.5)
+            height = font.getbbox("•")[3]
+            sprite = Image.new(self._canvas.mode, (width, height), self._paper)
+            if sprite.mode == "P":
+                sprite.putpalette(RED_PALETTE)
+            ImageDraw.Draw(sprite).text((0, 0), "•", font=font, fill=self.black)
+            bullet = self._bullets[font] = (sprite, width)
+        return bullet
+
 
 class DefaultTemplate(DisplayTemplate):
     """Default template with weather integration."""
@@ -34,44 +101,50 @@ class DefaultTemplate(DisplayTemplate):
     def __init__(self, width: int = 800, height: int = 480, color_mode: str = "red"):
         """Initialize default template."""
         super().__init__(width, height, color_mode)
+        self._body_key: Optional[bytes] = None
         self._load_fonts()
 
     def _load_fonts(self):
         """Load fonts with fallbacks."""
-        try:
-            self.font_large = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16)
-            self.font_medium = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 12)
-            self.font_small = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 10)
-        except (OSError, AttributeError):
-            try:
-                self.font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
-                self.font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-                self.font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10)
-            except (OSError, AttributeError):
-                self.font_large = ImageFont.load_default()
-                self.font_medium = ImageFont.load_default()
-                self.font_small = ImageFont.load_default()
+        self.font_large = _get_font((HELVETICA, DEJAVU), 16)
+        self.font_medium = _get_font((HELVETICA, DEJAVU), 12)
+        self.font_small = _get_font((HELVETICA, DEJAVU), 10)
 
     def render(self, events: List[Dict], weather: Optional[WeatherData] = None) -> Image.Image:
-        """Render default layout with optional weather."""
-        if self.color_mode == "red":
-            img = Image.new("RGB", (self.width, self.height), self.white)
+        """Render default layout with optional weather.
+
+        When events and weather are unchanged since the last render, only the
+        footer strip of the previous frame is redrawn.
+        """
+        key = self._content_key(events, weather)
+
+        if key == self._body_key:
+            img = self._canvas
+            draw = ImageDraw.Draw(img)
+            draw.rectangle((0, self.height - 20, self.width, self.height), fill=self._paper)
         else:
-            img = Image.new("1", (self.width, self.height), 1)
+            img = self._blank_canvas()
+            draw = ImageDraw.Draw(img)
 
-        draw = ImageDraw.Draw(img)
+            # Draw header with weather
+            self._draw_header(draw, weather)
 
-        # Draw header with weather
-        self._draw_header(draw, weather)
+            # Draw upcoming events
+            self._draw_events(img, draw, events)
 
-        # Draw upcoming events
-        self._draw_events(draw, events)
+            self._body_key = key
 
         # Draw footer with update time
         self._draw_footer(draw)
 
         return img
 
+    @staticmethod
+    def _content_key(events: List[Dict], weather: Optional[WeatherData]) -> bytes:
+        """Digest of everything drawn above the footer."""
+        payload = json.dumps([events, repr(weather)], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
     def _draw_header(self, draw: ImageDraw.ImageDraw, weather: Optional[WeatherData]):
         """Draw header with current time and weather."""
         y = 10
@@ -88,22 +161,23 @@ class DefaultTemplate(DisplayTemplate):
         line_y = y + 30
         draw.line([(10, line_y), (self.width - 10, line_y)], fill=self.black, width=1)
 
-    def _draw_events(self, draw: ImageDraw.ImageDraw, events: List[Dict]):
+    def _draw_events(self, img: Image.Image, draw: ImageDraw.ImageDraw, events: List[Dict]):
         """Draw upcoming events."""
         y = 50
         max_events = 5
 
-        for i, event in enumerate(events[:max_events]):
-            if y > self.height - 50:
-                break
+        # Format all lines up front so the draw loop only touches locals
+        rows = [(e.get("start", ""), (e.get("summary") or "Untitled")[:40])
+                for e in events[:max_events]]
+        font, fill, y_limit = self.font_small, self.black, self.height - 50
+        bullet, bullet_w = self._bullet(font)
 
-            # Format event line
-            start_time = event.get("start", "")
-            title = event.get("summary", "Untitled")[:40]
-            color = self.black
+        for start_time, title in rows:
+            if y > y_limit:
+                break
 
-            event_line = f"• {start_time} - {title}"
-            draw.text((20, y), event_line, font=self.font_small, fill=color)
+            img.paste(bullet, (20, y))
+            draw.text((20 + bullet_w, y), f"{start_time} - {title}", font=font, fill=fill)
 
             y += 25
 
@@ -131,32 +205,19 @@ class WeatherTemplate(DisplayTemplate):
 
     def _load_fonts(self):
         """Load fonts with fallbacks."""
-        try:
-            self.font_huge = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 48)
-            self.font_large = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 20)
-            self.font_medium = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 14)
-        except (OSError, AttributeError):
-            try:
-                self.font_huge = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 48)
-                self.font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 20)
-                self.font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-            except (OSError, AttributeError):
-                self.font_huge = ImageFont.load_default()
-                self.font_large = ImageFont.load_default()
-                self.font_medium = ImageFont.load_default()
+        self.font_huge = _get_font((HELVETICA, DEJAVU_BOLD), 48)
+        self.font_large = _get_font((HELVETICA, DEJAVU), 20)
+        self.font_medium = _get_font((HELVETICA, DEJAVU), 14)
 
     def render(self, events: List[Dict], weather: Optional[WeatherData] = None) -> Image.Image:
         """Render weather-focused layout."""
-        if self.color_mode == "red":
-            img = Image.new("RGB", (self.width, self.height), self.white)
-        else:
-            img = Image.new("1", (self.width, self.height), 1)
+        img = self._blank_canvas()
 
         draw = ImageDraw.Draw(img)
 
         if weather:
             self._draw_large_weather(draw, weather)
-            self._draw_events_compact(draw, events)
+            self._draw_events_compact(img, draw, events)
         else:
             draw.text((self.width // 2 - 80, self.height // 2), 
                      "No weather data", font=self.font_large, fill=self.black)
@@ -183,10 +244,13 @@ class WeatherTemplate(DisplayTemplate):
         # Horizontal line
         draw.line([(20, 230), (self.width - 20, 230)], fill=self.black, width=2)
 
-    def _draw_events_compact(self, draw: ImageDraw.ImageDraw, events: List[Dict]):
+    def _draw_events_compact(self, img: Image.Image, draw: ImageDraw.ImageDraw,
+                             events: List[Dict]):
         """Draw events in compact form below weather."""
         y = 250
+        bullet, bullet_w = self._bullet(self.font_medium)
         for event in events[:4]:
             title = event.get("summary", "Event")[:50]
-            draw.text((30, y), f"• {title}", font=self.font_medium, fill=self.black)
+            img.paste(bullet, (30, y))
+            draw.text((30 + bullet_w, y), title, font=self.font_medium, fill=self.black)
             y += 30
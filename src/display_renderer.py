@@ -1,15 +1,105 @@
 """PIL-based display renderer for 6-week calendar grid."""
 
+import hashlib
+import heapq
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+from datetime import date, datetime, timedelta
+from functools import cached_property
+from itertools import chain
+from operator import itemgetter
+from typing import Callable, List, Dict, Sequence, Tuple, Optional
 from PIL import Image, ImageDraw, ImageFont
-import textwrap
 
-from . import config
+from src.render_helpers import EventStarts, GlyphCache, blank_canvas, event_start, load_font
 
 logger = logging.getLogger(__name__)
 
+HELVETICA = "/System/Library/Fonts/Helvetica.ttc"
+DEJAVU = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+DEJAVU_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+# Fixed English names for the at-a-glance header, so no locale lookup is needed
+_WEEKDAYS = ("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY")
+_MONTHS = ("JANUARY", "FEBRUARY", "MARCH", "APRIL", "MAY", "JUNE", "JULY",
+           "AUGUST", "SEPTEMBER", "OCTOBER", "NOVEMBER", "DECEMBER")
+
+# 3x3 event indicator dot, rasterized once and stamped into cells with paste()
+_DOT_MASK = Image.new("1", (3, 3), 0)
+ImageDraw.Draw(_DOT_MASK).ellipse([(0, 0), (2, 2)], fill=1)
+
+# First candidate that loaded, per candidate tuple (None = PIL default font),
+# so later sizes skip the failed OSError probes
+_resolved_paths: Dict[Tuple[str, ...], Optional[str]] = {}
+
+def _load_font(paths: Tuple[str, ...], size: int) -> ImageFont.ImageFont:
+    """Load the first available font in paths at size, else PIL's default.
+    
+    Args:
+        paths: Candidate font files, in order of preference
+        size: Font size in points
+        
+    Returns:
+        Loaded font
+    """
+    if paths in _resolved_paths:
+        path = _resolved_paths[paths]
+        return load_font(path, size) if path else ImageFont.load_default()
+    
+    for path in paths:
+        try:
+            font = load_font(path, size)
+        except (OSError, AttributeError):
+            continue
+        _resolved_paths[paths] = path
+        return font
+    
+    _resolved_paths[paths] = None
+    return ImageFont.load_default()
+
+def _lazy_font(name: str) -> cached_property:
+    """Font attribute loaded from the owner's _FONT_SPECS on first access."""
+    def font(self) -> ImageFont.ImageFont:
+        try:
+            paths, size = self._FONT_SPECS[name]
+        except KeyError:
+            raise ValueError(f"Unknown font {name!r} for {type(self).__name__}") from None
+        return _load_font(paths, size)
+    
+    font.__name__ = name
+    return cached_property(font)
+
+def _render_key(update_time: Optional[datetime], *calendars: List[Dict]) -> Tuple:
+    """Key identifying a render's output: the shown minute plus a digest of the events.
+    
+    The digest covers each event's full payload, not just its id and version,
+    since events from the upcoming query or sample data may carry neither.
+    Seconds are dropped so the "Updated" time doesn't invalidate every render.
+    """
+    minute = (update_time or datetime.now()).replace(second=0, microsecond=0)
+    payload = json.dumps(calendars, sort_keys=True, default=str)
+    return minute, hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+def _prepare_events(events: List[Dict], owner: str,
+                    parse: Callable[[Dict], datetime]) -> List[Tuple[datetime, date, Dict, str]]:
+    """Pair each event with its parsed start for the at-a-glance layout.
+    
+    Args:
+        events: Events whose start is a dict (from the API) or an ISO string
+        owner: Owner tag carried alongside each event
+        parse: Event start parser, e.g. an EventStarts
+        
+    Returns:
+        List of (start datetime, start date, event, owner); events without
+        a parseable start time are skipped
+    """
+    prepared = []
+    for event in events:
+        start_dt = parse(event)
+        if start_dt is not datetime.min:
+            prepared.append((start_dt, start_dt.date(), event, owner))
+    return prepared
+
 class DisplayRenderer:
     """Renders calendar grid and events to PIL Image."""
     
@@ -22,6 +112,24 @@ class DisplayRenderer:
         "red": (255, 0, 0),
         "dark_grey": (100, 100, 100),
     }
+    # Red mode draws on a "P" canvas with these indexes (1 byte per pixel, not 3)
+    PALETTE_INDEX = {name: i for i, name in enumerate(COLORS)}
+    PALETTE = [c for rgb in COLORS.values() for c in rgb]
+    
+    # Event indicators drawn per grid cell
+    MAX_DOTS = 2
+    
+    # Font attribute -> (candidate paths, size), loaded on first use
+    _FONT_SPECS = {
+        "font_large": ((HELVETICA, DEJAVU), 14),
+        "font_medium": ((HELVETICA, DEJAVU), 11),
+        "font_small": ((HELVETICA, DEJAVU), 9),
+        "font_tiny": ((HELVETICA, DEJAVU), 7),
+    }
+    font_large = _lazy_font("font_large")
+    font_medium = _lazy_font("font_medium")
+    font_small = _lazy_font("font_small")
+    font_tiny = _lazy_font("font_tiny")
     
     def __init__(self, width: int = 800, height: int = 480, color_mode: str = "red"):
         """Initialize renderer.
@@ -35,38 +143,54 @@ class DisplayRenderer:
         self.height = height
         self.color_mode = color_mode
         
-        # For B&W mode, we need to use 0/1 for colors instead of RGB tuples
-        if self.color_mode == "bw":
+        # Resolve every mode-dependent colour once, so drawing never branches on the mode
+        if self.color_mode == "red":
+            index = self.PALETTE_INDEX
+            self.black_color = index["black"]
+            self.white_color = index["white"]
+            self.header_color = index["light_grey"]
+            self.highlight_color = index["light_grey"]
+            self.accent_color = index["red"]
+        else:
+            # 1-bit canvas: 0 is black, 1 is white; red falls back to black
             self.black_color = 0
             self.white_color = 1
-        else:
-            self.black_color = self.COLORS["black"]
-            self.white_color = self.COLORS["white"]
+            self.header_color = 1
+            self.highlight_color = 0  # Dark for B&W
+            self.accent_color = 0
+        # Fill for each owner's event dots, pasted through _DOT_MASK
+        self._dot_fills = {"red": self.accent_color, "black": self.black_color}
         
         # Layout dimensions
         self.header_height = 40
         self.event_list_height = 80
         self.grid_height = height - self.header_height - self.event_list_height
         
-        # Fonts (fallback to default)
-        try:
-            self.font_large = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 14)
-            self.font_medium = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 11)
-            self.font_small = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 9)
-            self.font_tiny = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 7)
-        except (OSError, AttributeError):
-            # Fallback for Linux/RPi
-            try:
-                self.font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-                self.font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11)
-                self.font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 9)
-                self.font_tiny = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 7)
-            except (OSError, AttributeError):
-                # Default font
-                self.font_large = ImageFont.load_default()
-                self.font_medium = ImageFont.load_default()
-                self.font_small = ImageFont.load_default()
-                self.font_tiny = ImageFont.load_default()
+        # Grid geometry only depends on the display size, so it is computed once.
+        # Cell edges sit on whole pixels so neighbouring cells share exact borders.
+        self.grid_top = self.header_height + 5
+        self.grid_left = 5
+        self.grid_width = width - 10
+        self._col_x = tuple(self.grid_left + col * self.grid_width // 7 for col in range(8))
+        self._row_y = tuple(self.grid_top + 15 + row * self.grid_height // 6 for row in range(7))
+        # (left, top, right, bottom) of each of the 42 cells, row by row
+        self._cells = tuple(
+            (self._col_x[col], self._row_y[row], self._col_x[col + 1], self._row_y[row + 1])
+            for row in range(6) for col in range(7)
+        )
+        # Masks for the grid's repeated labels
+        self._glyphs = GlyphCache("1")
+        # Static chrome (see _background), redrawn only when the day changes
+        self._background_day: Optional[date] = None
+        self._background_img: Optional[Image.Image] = None
+        # Dates shown in the cells, rebuilt only when the day changes
+        self._grid_today: Optional[date] = None
+        self._grid_dates: Tuple[date, ...] = ()
+        
+        # Canvas reused by every render; it holds the image drawn for _cache_key
+        self._canvas: Optional[Image.Image] = None
+        self._draw: Optional[ImageDraw.ImageDraw] = None
+        self._cache_key: Optional[Tuple] = None
     
     def render(self, ashi_events: List[Dict], sindi_events: List[Dict],
                update_time: Optional[datetime] = None) -> Image.Image:
@@ -78,34 +202,73 @@ class DisplayRenderer:
             update_time: Last update timestamp
             
         Returns:
-            PIL Image object
+            PIL Image object (the shared canvas; see _canvas_from)
         """
-        # Create base image
-        if self.color_mode == "red":
-            img = Image.new("RGB", (self.width, self.height), self.COLORS["white"])
-        else:
-            img = Image.new("1", (self.width, self.height), 1)  # 1-bit B&W
+        # Nothing changed since the last render: hand it back as is
+        key = _render_key(update_time, ashi_events, sindi_events)
+        if key == self._cache_key:
+            return self._canvas
         
-        draw = ImageDraw.Draw(img)
+        today = datetime.now().date()
+        img = self._canvas_from(self._background(today))
+        draw = self._draw
+        grid_dates = self._grid_days(today)
+        by_date = self._index_events_by_date(
+            ashi_events, sindi_events,
+            grid_dates[0].isoformat(), grid_dates[-1].isoformat()
+        )
         
-        # Draw components
-        self._draw_header(draw, update_time)
-        self._draw_calendar_grid(draw, ashi_events, sindi_events)
+        # Draw the changing parts over the day's static background
+        self._draw_timestamp(draw, update_time)
+        self._draw_event_dots(img, today, by_date)
         self._draw_event_list(draw, ashi_events, sindi_events)
         
+        self._cache_key = key
         return img
     
-    def _draw_header(self, draw: ImageDraw.ImageDraw, update_time: Optional[datetime]):
-        """Draw header with title and timestamp."""
-        # Header background
+    def _new_image(self) -> Image.Image:
+        """Create a white image in the renderer's colour mode."""
         if self.color_mode == "red":
-            bg_color = self.COLORS["light_grey"]
-        else:
-            bg_color = 1  # White for B&W (1 = white in 1-bit mode)
+            img = Image.new("P", (self.width, self.height), self.white_color)
+            img.putpalette(self.PALETTE)
+            return img
+        return Image.new("1", (self.width, self.height), 1)  # 1-bit B&W
+    
+    def _background(self, today: date) -> Image.Image:
+        """Get the parts of the display that only change once a day.
+        
+        Header bar and title, the grid with its day names, date numbers and
+        today's highlight, and the event list panel are drawn once per day.
+        """
+        if self._background_day != today:
+            img = self._new_image()
+            draw = ImageDraw.Draw(img)
+            self._draw_header(draw)
+            self._draw_calendar_grid(img, draw, today)
+            self._draw_event_list_panel(draw)
+            self._background_img, self._background_day = img, today
+        return self._background_img
+    
+    def _canvas_from(self, background: Image.Image) -> Image.Image:
+        """Get the renderer's canvas, reset to background.
         
+        The same image is returned by every render and overwritten by the next
+        one; callers must not modify it and should copy a frame they keep.
+        """
+        self._cache_key = None  # Canvas no longer holds the cached render
+        if self._canvas is None:
+            self._canvas = background.copy()
+            self._draw = ImageDraw.Draw(self._canvas)
+        else:
+            self._canvas.paste(background)
+        return self._canvas
+    
+    def _draw_header(self, draw: ImageDraw.ImageDraw):
+        """Draw header bar with title."""
+        # Header background
         draw.rectangle(
             [(0, 0), (self.width, self.header_height)],
-            fill=bg_color,
+            fill=self.header_color,
             outline=self.black_color
         )
         
@@ -117,12 +280,11 @@ class DisplayRenderer:
             fill=self.black_color,
             font=self.font_large
         )
-        
-        # Timestamp
-        if update_time:
-            timestamp = update_time.strftime("%Y-%m-%d %H:%M")
-        else:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    
+    def _draw_timestamp(self, draw: ImageDraw.ImageDraw, update_time: Optional[datetime]):
+        """Draw the last-update time in the header."""
+        ts = update_time or datetime.now()
+        timestamp = f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d} {ts.hour:02d}:{ts.minute:02d}"
         
         draw.text(
             (self.width - 150, 12),
@@ -131,122 +293,77 @@ class DisplayRenderer:
             font=self.font_small
         )
     
-    def _draw_calendar_grid(self, draw: ImageDraw.ImageDraw,
-                           ashi_events: List[Dict],
-                           sindi_events: List[Dict]):
-        """Draw 6-week (42-day) calendar grid."""
-        today = datetime.now().date()
-        start_date = today
-        
-        # Start from Sunday
-        while start_date.weekday() != 6:  # 6 = Sunday
-            start_date -= timedelta(days=1)
-        
-        # Grid parameters
-        grid_top = self.header_height + 5
-        grid_left = 5
-        grid_width = self.width - 10
-        grid_height = self.grid_height
-        
-        # Cell dimensions
-        cols = 7  # Days of week
-        rows = 6  # Weeks
-        cell_width = grid_width / cols
-        cell_height = grid_height / rows
+    def _draw_calendar_grid(self, img: Image.Image, draw: ImageDraw.ImageDraw, today: date):
+        """Draw 6-week (42-day) calendar grid, without event indicators."""
+        grid_top, grid_left = self.grid_top, self.grid_left
+        grid_width, grid_height = self.grid_width, self.grid_height
+        col_x, row_y = self._col_x, self._row_y
         
         # Draw grid background
-        if self.color_mode == "red":
-            bg_color = self.COLORS["white"]
-        else:
-            bg_color = 1  # White in B&W
-        
         draw.rectangle(
             [(grid_left, grid_top), (grid_left + grid_width, grid_top + grid_height)],
-            fill=bg_color,
+            fill=self.white_color,
             outline=self.black_color
         )
         
         # Day names
         day_names = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
         for i, day_name in enumerate(day_names):
-            x = grid_left + i * cell_width + 5
+            x = col_x[i] + 5
             y = grid_top + 2
-            draw.text((x, y), day_name, fill=self.black_color, font=self.font_small)
-        
-        # Draw cells and events
-        current_date = start_date
-        for row in range(rows):
-            for col in range(cols):
-                cell_left = grid_left + col * cell_width
-                cell_top = grid_top + 15 + row * cell_height
-                
-                # Cell border
-                draw.rectangle(
-                    [(cell_left, cell_top), (cell_left + cell_width, cell_top + cell_height)],
-                    outline=self.black_color,
-                    width=1
+            self._glyphs.stamp(img, (x, y), day_name, self.black_color, self.font_small)
+        
+        # Loop invariants, bound once instead of looked up in each of the 42 cells
+        black = self.black_color
+        highlight_color = self.highlight_color
+        font_medium = self.font_medium
+        rectangle, paste, glyph = draw.rectangle, img.paste, self._glyphs.glyph
+        
+        # Cell borders: one line per shared edge instead of an outline per cell
+        line = draw.line
+        for x in col_x:
+            line([(x, row_y[0]), (x, row_y[-1])], fill=black)
+        for y in row_y:
+            line([(col_x[0], y), (col_x[-1], y)], fill=black)
+        
+        # Draw cells
+        for (cell_left, cell_top, cell_right, cell_bottom), current_date in zip(
+                self._cells, self._grid_days(today)):
+            # Highlight today
+            if current_date == today:
+                rectangle(
+                    [(cell_left + 1, cell_top + 1),
+                     (cell_right - 1, cell_bottom - 1)],
+                    fill=highlight_color
                 )
-                
-                # Highlight today
-                if current_date == today:
-                    if self.color_mode == "red":
-                        highlight_color = self.COLORS["light_grey"]
-                    else:
-                        highlight_color = 0  # Dark for B&W
-                    
-                    draw.rectangle(
-                        [(cell_left + 1, cell_top + 1),
-                         (cell_left + cell_width - 1, cell_top + cell_height - 1)],
-                        fill=highlight_color
-                    )
-                
-                # Date number
-                date_str = str(current_date.day)
-                draw.text(
-                    (cell_left + 3, cell_top + 2),
-                    date_str,
-                    fill=self.black_color,
-                    font=self.font_medium
-                )
-                
-                # Event indicators
-                day_events = self._get_events_for_date(
-                    current_date,
-                    ashi_events,
-                    sindi_events
-                )
-                
-                indicator_y = cell_top + 18
-                for i, (event, color) in enumerate(day_events[:2]):  # Max 2 indicators per cell
-                    if self.color_mode == "red" and color == "red":
-                        dot_color = self.COLORS["red"]
-                    else:
-                        dot_color = self.COLORS["black"]
-                    
-                    x = cell_left + 3 + (i * 3)
-                    draw.ellipse(
-                        [(x, indicator_y), (x + 2, indicator_y + 2)],
-                        fill=dot_color
-                    )
-                
-                current_date += timedelta(days=1)
+            
+            # Date number, pasted from a cached mask instead of laid out again
+            mask, (dx, dy) = glyph(str(current_date.day), font_medium)
+            paste(black, (cell_left + 3 + dx, cell_top + 2 + dy), mask)
     
-    def _draw_event_list(self, draw: ImageDraw.ImageDraw,
-                        ashi_events: List[Dict],
-                        sindi_events: List[Dict]):
-        """Draw today's + next 3 upcoming events at bottom."""
+    def _draw_event_dots(self, img: Image.Image, today: date,
+                         by_date: Dict[str, List[Tuple[Dict, str]]]):
+        """Draw each grid cell's event indicators."""
+        dot_fills = self._dot_fills
+        paste = img.paste
+        
+        for (cell_left, cell_top, _, _), current_date in zip(self._cells, self._grid_days(today)):
+            day_events = self._get_events_for_date(current_date, by_date)
+            
+            indicator_y = cell_top + 18
+            for i, (event, color) in enumerate(day_events):  # Max MAX_DOTS per cell
+                x = cell_left + 3 + (i * 3)
+                paste(dot_fills[color], (x, indicator_y), _DOT_MASK)
+    
+    def _draw_event_list_panel(self, draw: ImageDraw.ImageDraw):
+        """Draw the event list's background and heading."""
         list_top = self.header_height + self.grid_height + 5
         list_height = self.event_list_height
         
         # Background
-        if self.color_mode == "red":
-            bg_color = self.COLORS["white"]
-        else:
-            bg_color = 1  # White in B&W
-        
         draw.rectangle(
             [(0, list_top), (self.width, list_top + list_height)],
-            fill=bg_color,
+            fill=self.white_color,
             outline=self.black_color
         )
         
@@ -257,23 +374,30 @@ class DisplayRenderer:
             fill=self.black_color,
             font=self.font_medium
         )
+    
+    def _draw_event_list(self, draw: ImageDraw.ImageDraw,
+                        ashi_events: List[Dict],
+                        sindi_events: List[Dict]):
+        """Draw today's + next 3 upcoming events at bottom."""
+        list_top = self.header_height + self.grid_height + 5
+        list_height = self.event_list_height
         
         # Get today + next 3 events
         all_events = self._get_upcoming_events(ashi_events, sindi_events, limit=4)
         
+        font = self.font_small
+        text = draw.text
+        # Two-colour rows place the text where a single joined "X text" string would
+        text_x = 5 + font.getlength("A ")
+        
         y = list_top + 18
         for i, (event, owner) in enumerate(all_events[:4]):
             if y + 12 > list_top + list_height:
                 break
             
             # Get event time and title
-            start = event.get("start", {})
-            start_time = start.get("dateTime", start.get("date", ""))
-            
-            if "T" in start_time:
-                time_str = start_time[11:16]  # HH:MM
-            else:
-                time_str = "All day"
+            start_time, has_time = event_start(event)
+            time_str = start_time[11:16] if has_time else "All day"  # HH:MM
             
             # Truncate title
             title = event.get("summary", "Untitled")[:30]
@@ -281,38 +405,74 @@ class DisplayRenderer:
             # Owner color
             if owner == "ashi":
                 owner_indicator = "A"
-                text_color = self.COLORS["red"] if self.color_mode == "red" else self.black_color
+                text_color = self.accent_color
             else:
                 owner_indicator = "S"
                 text_color = self.black_color
             
-            # Draw indicator and text
-            draw.text((5, y), f"{owner_indicator}", fill=text_color, font=self.font_small)
-            draw.text((15, y), f"{time_str} {title}", fill=self.black_color, font=self.font_small)
+            # Draw indicator and text, in one call when they share a colour
+            if text_color == self.black_color:
+                text((5, y), f"{owner_indicator} {time_str} {title}", fill=text_color, font=font)
+            else:
+                text((5, y), owner_indicator, fill=text_color, font=font)
+                text((text_x, y), f"{time_str} {title}", fill=self.black_color, font=font)
             
             y += 12
     
-    def _get_events_for_date(self, date, ashi_events: List[Dict],
-                            sindi_events: List[Dict]) -> List[Tuple[Dict, str]]:
-        """Get events for a specific date.
+    def _grid_start(self, today: date) -> date:
+        """First day shown in the grid: the Sunday on or before today."""
+        # weekday() is 6 for Sunday; Monday (0) steps back 1 day
+        return date.fromordinal(today.toordinal() - (today.weekday() + 1) % 7)
+    
+    def _grid_days(self, today: date) -> Tuple[date, ...]:
+        """The 42 dates shown in the grid, rebuilt only when today changes."""
+        if today != self._grid_today:
+            start_ord = self._grid_start(today).toordinal()
+            fromordinal = date.fromordinal
+            self._grid_dates = tuple(fromordinal(start_ord + i) for i in range(42))
+            self._grid_today = today
+        return self._grid_dates
+    
+    def _index_events_by_date(self, ashi_events: List[Dict], sindi_events: List[Dict],
+                              first_day: str = "", last_day: str = "\uffff"
+                              ) -> Dict[str, List[Tuple[Dict, str]]]:
+        """Bucket events by start date in one pass over both calendars.
+        
+        Only what the grid can show is kept: days inside [first_day, last_day]
+        and at most MAX_DOTS events per day, so large calendars cost a string
+        comparison per event rather than growing the buckets.
         
+        Args:
+            ashi_events: Ashi's events (red)
+            sindi_events: Sindi's events (black)
+            first_day: First ISO date to keep (default: no lower bound)
+            last_day: Last ISO date to keep (default: no upper bound)
+            
         Returns:
-            List of (event, owner) tuples
+            Dict of ISO date -> list of (event, color) tuples
         """
-        events = []
-        date_str = date.isoformat()
-        
-        for event in ashi_events:
-            start = event.get("start", {}).get("dateTime", event.get("start", {}).get("date", ""))
-            if start.startswith(date_str):
-                events.append((event, "red"))
-        
-        for event in sindi_events:
-            start = event.get("start", {}).get("dateTime", event.get("start", {}).get("date", ""))
-            if start.startswith(date_str):
-                events.append((event, "black"))
+        by_date = {}
+        max_dots = self.MAX_DOTS
+        for events, color in ((ashi_events, "red"), (sindi_events, "black")):
+            for event in events:
+                day = event_start(event)[0][:10]
+                if not first_day <= day <= last_day:
+                    continue
+                bucket = by_date.get(day)
+                if bucket is None:
+                    by_date[day] = [(event, color)]
+                elif len(bucket) < max_dots:
+                    bucket.append((event, color))
+        return by_date
+    
+    def _get_events_for_date(self, date,
+                            by_date: Dict[str, List[Tuple[Dict, str]]]) -> Sequence[Tuple[Dict, str]]:
+        """Get events for a specific date.
         
-        return events
+        Returns:
+            Sequence of (event, owner) tuples (a shared empty tuple for free days)
+        """
+        return by_date.get(date.isoformat(), ())
     
     def _get_upcoming_events(self, ashi_events: List[Dict],
                             sindi_events: List[Dict],
@@ -322,22 +482,15 @@ class DisplayRenderer:
         Returns:
             List of (event, owner) tuples
         """
-        events = []
-        
-        for event in ashi_events:
-            events.append((event, "ashi"))
-        
-        for event in sindi_events:
-            events.append((event, "sindi"))
-        
-        # Sort by start time
-        def get_start_time(item):
-            event, _ = item
-            start = event.get("start", {})
-            return start.get("dateTime", start.get("date", ""))
+        # Decorate with the start string once, tagging owners without a combined list
+        keyed = chain(
+            ((event_start(event)[0], event, "ashi") for event in ashi_events),
+            ((event_start(event)[0], event, "sindi") for event in sindi_events),
+        )
         
-        events.sort(key=get_start_time)
-        return events[:limit]
+        # Only the first few are shown: partial selection instead of a full sort
+        top = heapq.nsmallest(limit, keyed, key=itemgetter(0))
+        return [(event, owner) for _, event, owner in top]
     
     def save(self, image: Image.Image, path: str):
         """Save image to file.
@@ -362,23 +515,35 @@ class AtAGlanceRenderer:
         "dark_grey": (100, 100, 100),
     }
     
+    # Larger sizes for easy reading, loaded on first use
+    _FONT_SPECS = {
+        "font_xl": ((DEJAVU_BOLD,), 32),
+        "font_large": ((DEJAVU_BOLD,), 18),
+        "font_medium": ((DEJAVU,), 14),
+        "font_small": ((DEJAVU,), 11),
+    }
+    font_xl = _lazy_font("font_xl")
+    font_large = _lazy_font("font_large")
+    font_medium = _lazy_font("font_medium")
+    font_small = _lazy_font("font_small")
+    
     def __init__(self, width: int = 800, height: int = 480):
         """Initialize at-a-glance renderer."""
         self.width = width
         self.height = height
         
-        # Load fonts (larger sizes for easy reading)
-        try:
-            self.font_xl = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 32)
-            self.font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 18)
-            self.font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-            self.font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11)
-        except (OSError, AttributeError):
-            # Fallback
-            self.font_xl = ImageFont.load_default()
-            self.font_large = ImageFont.load_default()
-            self.font_medium = ImageFont.load_default()
-            self.font_small = ImageFont.load_default()
+        # Layout dimensions
+        self.header_height = 50
+        self.today_top = self.header_height + 30  # First event row under "TODAY:"
+        self.footer_height = 30
+        
+        # Parsed start per event for the render in progress
+        self._starts = EventStarts()
+        
+        # Canvas reused by every render; it holds the image drawn for _cache_key
+        self._canvas: Optional[Image.Image] = None
+        self._draw: Optional[ImageDraw.ImageDraw] = None
+        self._cache_key: Optional[Tuple] = None
     
     def render(self, ashi_events: List[Dict], sindi_events: List[Dict],
                update_time: Optional[datetime] = None) -> Image.Image:
@@ -396,63 +561,46 @@ class AtAGlanceRenderer:
             update_time: Last update timestamp
             
         Returns:
-            PIL Image (800x480)
+            PIL Image (800x480), the shared canvas (see _blank_canvas)
         """
-        # Create white background
-        img = Image.new("RGB", (self.width, self.height), self.COLORS["white"])
-        draw = ImageDraw.Draw(img)
+        # Nothing changed since the last render: hand it back as is
+        key = _render_key(update_time, ashi_events, sindi_events)
+        if key == self._cache_key:
+            return self._canvas
+        
+        # White background
+        img = self._blank_canvas()
+        draw = self._draw
         
         today = datetime.now()
-        all_events = ashi_events + sindi_events
+        self._starts.reset()
+        prepared = _prepare_events(ashi_events, "ashi", self._starts)
+        prepared.extend(_prepare_events(sindi_events, "sindi", self._starts))
         
         # ===== HEADER: Today's date (LARGE) =====
-        today_str = today.strftime("%A, %B %d").upper()
+        today_str = f"{_WEEKDAYS[today.weekday()]}, {_MONTHS[today.month - 1]} {today.day:02d}"
         draw.text((20, 8), today_str, font=self.font_xl, fill=self.COLORS["black"])
         
         # ===== TODAY'S EVENTS =====
-        y = header_h + 5
+        y = self.header_height + 5
         draw.text((20, y), "TODAY:", font=self.font_large, fill=self.COLORS["black"])
         y += 25
         
-        # Parse today's events
-        today_events = []
-        for e in (ashi_events + sindi_events):
-            try:
-                # Handle both dict-based start times (from API) and ISO strings
-                if isinstance(e.get('start'), dict):
-                    start_str = e['start'].get('dateTime', '')
-                    if not start_str:
-                        continue  # Skip events without start time
-                    start_dt = datetime.fromisoformat(start_str)
-                else:
-                    start_str = e.get('start', '')
-                    if not start_str:
-                        continue
-                    start_dt = datetime.fromisoformat(start_str)
-                
-                if start_dt.date() == today.date():
-                    today_events.append(e)
-            except (ValueError, KeyError, TypeError):
-                # Skip malformed events
-                continue
+        today_date = today.date()
+        today_events = [p for p in prepared if p[1] == today_date]
         
         if today_events:
-            for evt in today_events[:3]:  # Show max 3 events
-                # Parse start time
-                if isinstance(evt.get('start'), dict):
-                    start_time = datetime.fromisoformat(evt['start']['dateTime']).strftime("%H:%M")
-                else:
-                    start_time = datetime.fromisoformat(evt['start']).strftime("%H:%M")
-                
-                title = evt.get('title', 'Untitled')[:40]  # Truncate long titles
-                color = self.COLORS["red"] if evt in ashi_events else self.COLORS["black"]
+            for start_dt, _, evt, owner in today_events[:3]:  # Show max 3 events
+                start_time = start_dt.strftime("%H:%M")
+                title = evt.get('summary', evt.get('title', 'Untitled'))[:40]  # Truncate long titles
+                color = self.COLORS["red"] if owner == "ashi" else self.COLORS["black"]
                 draw.text((40, y), f"{start_time} - {title}", font=self.font_small, fill=color)
                 y += 20
         else:
             draw.text((40, y), "No events today", font=self.font_small, fill=self.COLORS["grey"])
         
         # ===== NEXT 3 WEEKS CALENDAR =====
-        y = today_h + 70
+        y = self.today_top + 70
         draw.line([(20, y), (self.width - 20, y)], fill=self.COLORS["grey"], width=1)
         y += 10
         draw.text((20, y), "NEXT 3 WEEKS:", font=self.font_large, fill=self.COLORS["black"])
@@ -467,29 +615,12 @@ class AtAGlanceRenderer:
             draw.text((20, y), week_label, font=self.font_medium, fill=self.COLORS["black"])
             
             # Count events this week
-            week_events = []
-            for e in (ashi_events + sindi_events):
-                try:
-                    # Parse event date
-                    if isinstance(e.get('start'), dict):
-                        start_str = e['start'].get('dateTime', '')
-                        if not start_str:
-                            continue
-                        evt_date = datetime.fromisoformat(start_str).date()
-                    else:
-                        start_str = e.get('start', '')
-                        if not start_str:
-                            continue
-                        evt_date = datetime.fromisoformat(start_str).date()
-                    
-                    if week_start.date() <= evt_date <= week_end.date():
-                        week_events.append(e)
-                except (ValueError, KeyError, TypeError):
-                    continue
+            first, last = week_start.date(), week_end.date()
+            week_events = [p for p in prepared if first <= p[1] <= last]
             
             if week_events:
                 event_summary = f"{len(week_events)} events"
-                ashi_count = len([e for e in week_events if e in ashi_events])
+                ashi_count = sum(1 for *_, owner in week_events if owner == "ashi")
                 if ashi_count > 0:
                     event_summary += f" ({ashi_count} yours)"
                 draw.text((self.width - 200, y), event_summary, font=self.font_small, fill=self.COLORS["dark_grey"])
@@ -497,7 +628,7 @@ class AtAGlanceRenderer:
             y += 22
         
         # ===== FOOTER: Legend + update time =====
-        y = self.height - footer_h + 5
+        y = self.height - self.footer_height + 5
         draw.text((20, y), "Legend:", font=self.font_small, fill=self.COLORS["black"])
         draw.text((100, y), "Red = Ashi  |  Black = Sindi", font=self.font_small, fill=self.COLORS["dark_grey"])
         
@@ -505,19 +636,23 @@ class AtAGlanceRenderer:
             update_str = f"Updated: {update_time.strftime('%H:%M')}"
             draw.text((self.width - 200, y), update_str, font=self.font_small, fill=self.COLORS["grey"])
         
+        self._cache_key = key
         return img
     
+    def _blank_canvas(self) -> Image.Image:
+        """Get the renderer's canvas, cleared to white.
+        
+        The same image is returned by every render and overwritten by the next
+        one; callers must not modify it and should copy a frame they keep.
+        """
+        self._cache_key = None  # Canvas no longer holds the cached render
+        self._canvas = blank_canvas(self._canvas, "RGB", (self.width, self.height),
+                                    self.COLORS["white"])
+        if self._draw is None:
+            self._draw = ImageDraw.Draw(self._canvas)
+        return self._canvas
+    
     def save(self, img: Image.Image, path: str = "display_output.png"):
         """Save image to file."""
         img.save(path)
         logger.info(f"Saved at-a-glance image to {path}")
-
-
-if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO)
-    
-    # Test renderer
-    renderer = DisplayRenderer(800, 480, "red")
-    img = renderer.render([], [])
-    renderer.save(img, "test_display.png")
-    print("Test image saved to test_display.png")
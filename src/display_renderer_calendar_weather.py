@@ -7,13 +7,21 @@ Layout:
 Colors: Black (text) and Red (accents) only - compatible with Waveshare red/black display
 """
 
+import hashlib
+import json
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import List, Dict, Optional, Tuple
 from PIL import Image, ImageDraw, ImageFont
 
+from src.render_helpers import EventStarts, event_start, index_events, load_font
+
 logger = logging.getLogger(__name__)
 
+DEJAVU = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+DEJAVU_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
 
 class CalendarWeatherRenderer:
     """Renders calendar + weather in single view optimized for red/black e-paper."""
@@ -25,6 +33,9 @@ class CalendarWeatherRenderer:
         "grey": (200, 200, 200),
         "dark_grey": (100, 100, 100),
     }
+    # Drawn on a "P" canvas with these indexes (1 byte per pixel, not 3)
+    PALETTE_INDEX = {name: i for i, name in enumerate(COLORS)}
+    PALETTE = [c for rgb in COLORS.values() for c in rgb]
     
     # Weather icons using text symbols only (no color)
     WEATHER_ICONS = {
@@ -46,15 +57,21 @@ class CalendarWeatherRenderer:
         """Initialize renderer."""
         self.width = width
         self.height = height
-        self.mid_x = int(width * 0.6)  # 60/40 split
+        self.mid_x = width * 3 // 5  # 60/40 split, in whole pixels
+        
+        # Parsed start per event for the render in progress
+        self._starts = EventStarts()
+        # Last render without its footer, and the _signature it was drawn for
+        self._base: Optional[Image.Image] = None
+        self._base_key: Optional[Tuple] = None
         
         # Load fonts
         try:
-            self.font_xl = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 28)
-            self.font_lg = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 18)
-            self.font_med = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14)
-            self.font_sm = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-            self.font_xs = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 9)
+            self.font_xl = load_font(DEJAVU_BOLD, 28)
+            self.font_lg = load_font(DEJAVU_BOLD, 18)
+            self.font_med = load_font(DEJAVU_BOLD, 14)
+            self.font_sm = load_font(DEJAVU, 12)
+            self.font_xs = load_font(DEJAVU, 9)
         except (OSError, AttributeError):
             self.font_xl = ImageFont.load_default()
             self.font_lg = ImageFont.load_default()
@@ -78,87 +95,114 @@ class CalendarWeatherRenderer:
         Returns:
             PIL Image (800x480)
         """
-        img = Image.new("RGB", (self.width, self.height), self.COLORS["white"])
-        draw = ImageDraw.Draw(img)
-        
-        # Vertical divider
-        draw.line([(self.mid_x, 0), (self.mid_x, self.height)],
-                 fill=self.COLORS["grey"], width=2)
-        
-        # Left: Calendar
-        self._render_calendar(draw, ashi_events, sindi_events)
+        # Only the footer changes between refreshes with the same events and weather
+        key = self._signature(ashi_events, sindi_events, weather_forecast, current_weather)
+        if key != self._base_key:
+            self._starts.reset()
+            base = Image.new("P", (self.width, self.height), self.PALETTE_INDEX["white"])
+            base.putpalette(self.PALETTE)
+            draw = ImageDraw.Draw(base)
+            
+            # Vertical divider
+            draw.line([(self.mid_x, 0), (self.mid_x, self.height)],
+                     fill=self.PALETTE_INDEX["grey"], width=2)
+            
+            # Left: Calendar
+            self._render_calendar(draw, ashi_events, sindi_events)
+            
+            # Right: Weather
+            self._render_weather(draw, weather_forecast, current_weather)
+            
+            self._base, self._base_key = base, key
         
-        # Right: Weather
-        self._render_weather(draw, weather_forecast, current_weather)
+        img = self._base.copy()
         
         # Footer: Update time
         if update_time:
             update_str = f"Updated: {update_time.strftime('%H:%M')}"
-            draw.text((self.mid_x + 10, self.height - 15), update_str,
-                     font=self.font_xs, fill=self.COLORS["grey"])
+            ImageDraw.Draw(img).text((self.mid_x + 10, self.height - 15), update_str,
+                                     font=self.font_xs, fill=self.PALETTE_INDEX["grey"])
         
         return img
     
+    def _signature(self, ashi_events: List[Dict], sindi_events: List[Dict],
+                   weather_forecast: Optional[List[Dict]],
+                   current_weather: Optional[Dict]) -> Tuple:
+        """Key identifying everything drawn except the footer.
+        
+        The day is included because the headings and "TODAY" follow the
+        clock; events and weather are digested whole, since events without
+        an id or version still differ in their titles and times.
+        """
+        payload = json.dumps([ashi_events, sindi_events, weather_forecast, current_weather],
+                             sort_keys=True, default=str)
+        return (
+            datetime.now().date(),
+            hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest(),
+        )
+    
     def _render_calendar(self, draw: ImageDraw.ImageDraw,
                          ashi_events: List[Dict], sindi_events: List[Dict]):
         """Render calendar on left side."""
         today = datetime.now()
-        all_events = ashi_events + sindi_events
+        by_date = index_events(ashi_events, sindi_events, self._starts)
+        
+        # Palette indexes and fonts, bound once for the event loops
+        index = self.PALETTE_INDEX
+        black, red = index["black"], index["red"]
+        grey, dark_grey = index["grey"], index["dark_grey"]
+        font_sm = self.font_sm
+        text = draw.text
         
         x_start = 20
         y_start = 15
         
         # Title with compact date
         date_str = today.strftime("%a, %b %d").upper()
-        draw.text((x_start, y_start), date_str, font=self.font_xl,
-                 fill=self.COLORS["black"])
+        text((x_start, y_start), date_str, font=self.font_xl, fill=black)
         
         # Divider
         draw.line([(x_start, y_start + 32), (self.mid_x - 10, y_start + 32)],
-                 fill=self.COLORS["grey"], width=1)
+                 fill=grey, width=1)
         
         y = y_start + 42
         
         # Show today's events first
-        draw.text((x_start, y), "TODAY", font=self.font_med,
-                 fill=self.COLORS["black"])
+        text((x_start, y), "TODAY", font=self.font_med, fill=black)
         y += 22
         
-        today_events = self._get_events_by_date(all_events, ashi_events, today)
+        today_events = by_date.get(today.date(), [])
         if today_events:
-            for evt in today_events[:3]:
+            for _, evt, is_ashi in islice(today_events, 3):
                 time_str = self._format_time(evt)
                 title = evt.get('summary') or evt.get('title') or 'Untitled'
                 title = title[:25]
-                color = self.COLORS["red"] if evt in ashi_events else self.COLORS["black"]
+                color = red if is_ashi else black
                 
-                draw.text((x_start + 5, y), f"{time_str}", font=self.font_sm,
-                         fill=self.COLORS["dark_grey"])
-                draw.text((x_start + 50, y), title, font=self.font_sm, fill=color)
+                text((x_start + 5, y), f"{time_str}", font=font_sm, fill=dark_grey)
+                text((x_start + 50, y), title, font=font_sm, fill=color)
                 y += 18
         else:
-            draw.text((x_start + 5, y), "No events", font=self.font_sm,
-                     fill=self.COLORS["grey"])
+            text((x_start + 5, y), "No events", font=font_sm, fill=grey)
             y += 18
         
         # Next 2 days
         y += 8
         for day_offset in range(1, 3):
             check_date = today + timedelta(days=day_offset)
-            day_events = self._get_events_by_date(all_events, ashi_events, check_date)
+            day_events = by_date.get(check_date.date(), [])
             
             if day_events:
                 day_label = check_date.strftime("%a %m/%d").upper()
-                draw.text((x_start, y), day_label, font=self.font_sm,
-                         fill=self.COLORS["black"])
+                text((x_start, y), day_label, font=font_sm, fill=black)
                 y += 18
                 
-                for evt in day_events[:1]:  # Max 1 per day to save space
+                for _, evt, is_ashi in islice(day_events, 1):  # Max 1 per day to save space
                     title = evt.get('summary') or evt.get('title') or 'Untitled'
                     title = title[:22]
-                    color = self.COLORS["red"] if evt in ashi_events else self.COLORS["black"]
+                    color = red if is_ashi else black
                     
-                    draw.text((x_start + 5, y), title, font=self.font_sm, fill=color)
+                    text((x_start + 5, y), title, font=font_sm, fill=color)
                     y += 16
                 
                 y += 4
@@ -167,12 +211,16 @@ class CalendarWeatherRenderer:
                         weather_forecast: Optional[List[Dict]] = None,
                         current_weather: Optional[Dict] = None):
         """Render weather on right side."""
+        index = self.PALETTE_INDEX
+        black, grey, dark_grey = index["black"], index["grey"], index["dark_grey"]
+        font_sm, font_xs = self.font_sm, self.font_xs
+        text = draw.text
+        
         x_start = self.mid_x + 15
         y_start = 15
         
         # Title
-        draw.text((x_start, y_start), "WEATHER", font=self.font_lg,
-                 fill=self.COLORS["black"])
+        text((x_start, y_start), "WEATHER", font=self.font_lg, fill=black)
         
         y = y_start + 35
         
@@ -181,20 +229,16 @@ class CalendarWeatherRenderer:
             temp = current_weather.get('temp', '--')
             condition = current_weather.get('condition', 'Unknown')[:15]
             
-            draw.text((x_start, y), f"{temp}°", font=self.font_xl,
-                     fill=self.COLORS["black"])
-            draw.text((x_start, y + 32), condition, font=self.font_sm,
-                     fill=self.COLORS["dark_grey"])
+            text((x_start, y), f"{temp}°", font=self.font_xl, fill=black)
+            text((x_start, y + 32), condition, font=font_sm, fill=dark_grey)
             
             y += 70
         
         # 3-day forecast
-        draw.line([(x_start, y), (self.width - 20, y)],
-                 fill=self.COLORS["grey"], width=1)
+        draw.line([(x_start, y), (self.width - 20, y)], fill=grey, width=1)
         y += 8
         
-        draw.text((x_start, y), "3-DAY", font=self.font_med,
-                 fill=self.COLORS["black"])
+        text((x_start, y), "3-DAY", font=self.font_med, fill=black)
         y += 22
         
         if weather_forecast:
@@ -209,64 +253,21 @@ class CalendarWeatherRenderer:
                 temp_low = day_forecast.get('temp_low', '--')
                 condition = day_forecast.get('condition', '?')[:8]
                 
-                draw.text((x_start, y), f"{day_label} {temp_high}°/{temp_low}°",
-                         font=self.font_sm, fill=self.COLORS["black"])
-                draw.text((x_start, y + 16), condition, font=self.font_xs,
-                         fill=self.COLORS["dark_grey"])
+                text((x_start, y), f"{day_label} {temp_high}°/{temp_low}°",
+                     font=font_sm, fill=black)
+                text((x_start, y + 16), condition, font=font_xs, fill=dark_grey)
                 
                 y += 32
     
-    def _get_events_by_date(self, all_events: List[Dict], ashi_events: List[Dict],
-                            target_date: datetime) -> List[Dict]:
-        """Get events for a date, sorted by time."""
-        day_events = []
-        for e in all_events:
-            try:
-                if isinstance(e.get('start'), dict):
-                    start_str = e['start'].get('dateTime', '')
-                else:
-                    start_str = e.get('start', '')
-                
-                if not start_str:
-                    continue
-                
-                evt_dt = datetime.fromisoformat(start_str)
-                if evt_dt.date() == target_date.date():
-                    day_events.append(e)
-            except (ValueError, KeyError, TypeError):
-                continue
-        
-        try:
-            day_events.sort(key=lambda e: self._parse_datetime(e))
-        except:
-            pass
-        
-        return day_events
-    
-    def _parse_datetime(self, event: Dict) -> datetime:
-        """Parse event datetime."""
-        if isinstance(event.get('start'), dict):
-            start_str = event['start'].get('dateTime', '')
-        else:
-            start_str = event.get('start', '')
-        
-        if start_str:
-            try:
-                return datetime.fromisoformat(start_str)
-            except:
-                pass
-        
-        return datetime.min
-    
     def _format_time(self, event: Dict) -> str:
         """Format time as HH:MM."""
-        try:
-            dt = self._parse_datetime(event)
-            if dt != datetime.min:
-                return dt.strftime("%H:%M")
-        except:
-            pass
-        return "--:--"
+        start_str, has_time = event_start(event)
+        if has_time and len(start_str) >= 16:
+            return start_str[11:16]  # Already HH:MM in an ISO date-time
+        
+        # Shorter forms (e.g. "2026-03-02T10") go through the parsed start
+        dt = self._starts(event)
+        return "--:--" if dt is datetime.min else dt.strftime("%H:%M")
     
     def save(self, img: Image.Image, path: str = "calendar_weather.png"):
         """Save image."""
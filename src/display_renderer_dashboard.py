@@ -2,11 +2,19 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional
 from PIL import Image, ImageDraw, ImageFont
 
+from src.render_helpers import EventStarts, GlyphCache, blank_canvas, index_events, load_font
+
 logger = logging.getLogger(__name__)
 
+DEJAVU = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+DEJAVU_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+# Upper-case %a / %b names, indexed by weekday() and month - 1
+_DAYNAMES = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+
 
 class DashboardRenderer:
     """Renders multi-panel dashboard: calendar + weather + stocks.
@@ -28,6 +36,9 @@ class DashboardRenderer:
         "green": (0, 128, 0),      # Green for positive stocks
         "red": (200, 0, 0),        # Red for negative stocks
     }
+    # Drawn on a "P" canvas with these indexes (1 byte per pixel, not 3)
+    PALETTE_INDEX = {name: i for i, name in enumerate(COLORS)}
+    PALETTE = [c for rgb in COLORS.values() for c in rgb]
     
     def __init__(self, width: int = 800, height: int = 480):
         """Initialize dashboard renderer."""
@@ -37,17 +48,26 @@ class DashboardRenderer:
         
         # Load fonts
         try:
-            self.font_xl = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 32)
-            self.font_lg = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20)
-            self.font_med = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-            self.font_sm = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11)
-            self.font_xs = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 9)
+            self.font_xl = load_font(DEJAVU_BOLD, 32)
+            self.font_lg = load_font(DEJAVU_BOLD, 20)
+            self.font_med = load_font(DEJAVU, 14)
+            self.font_sm = load_font(DEJAVU, 11)
+            self.font_xs = load_font(DEJAVU, 9)
         except (OSError, AttributeError):
             self.font_xl = ImageFont.load_default()
             self.font_lg = ImageFont.load_default()
             self.font_med = ImageFont.load_default()
             self.font_sm = ImageFont.load_default()
             self.font_xs = ImageFont.load_default()
+        
+        # Masks for labels and event times, expired each day
+        self._glyphs = GlyphCache("1")
+        # Parsed start per event for the render in progress
+        self._starts = EventStarts()
+        
+        # Canvas reused by every render
+        self._canvas: Optional[Image.Image] = None
+        self._draw: Optional[ImageDraw.ImageDraw] = None
     
     def render(self, ashi_events: List[Dict], sindi_events: List[Dict],
                stocks: Optional[Dict] = None, weather: Optional[Dict] = None,
@@ -62,103 +82,100 @@ class DashboardRenderer:
             update_time: Last update timestamp
             
         Returns:
-            PIL Image (800x480)
+            PIL Image (800x480), the shared canvas (see _blank_canvas)
         """
-        img = Image.new("RGB", (self.width, self.height), self.COLORS["white"])
-        draw = ImageDraw.Draw(img)
+        self._starts.reset()
+        self._glyphs.expire(datetime.now().date())
+        
+        img = self._blank_canvas()
+        draw = self._draw
         
         # Draw vertical divider
         draw.line([(self.mid_x, 0), (self.mid_x, self.height)], 
-                 fill=self.COLORS["grey"], width=1)
+                 fill=self.PALETTE_INDEX["grey"], width=1)
         
         # Draw horizontal divider on right side
         draw.line([(self.mid_x, 240), (self.width, 240)], 
-                 fill=self.COLORS["grey"], width=1)
+                 fill=self.PALETTE_INDEX["grey"], width=1)
         
         # Left panel: Calendar
-        self._render_calendar(draw, ashi_events, sindi_events)
+        self._render_calendar(img, draw, ashi_events, sindi_events)
         
         # Top right: Weather
-        self._render_weather(draw, weather)
+        self._render_weather(img, draw, weather)
         
         # Bottom right: Stocks
-        self._render_stocks(draw, stocks)
+        self._render_stocks(img, draw, stocks)
         
         # Footer with update time
         if update_time:
-            update_str = f"Updated: {update_time.strftime('%H:%M')}"
+            update_str = f"Updated: {update_time.hour:02d}:{update_time.minute:02d}"
             draw.text((self.mid_x + 10, self.height - 15), update_str, 
-                     font=self.font_xs, fill=self.COLORS["grey"])
+                     font=self.font_xs, fill=self.PALETTE_INDEX["grey"])
         
         return img
     
-    def _render_calendar(self, draw: ImageDraw.ImageDraw, 
+    def _render_calendar(self, img: Image.Image, draw: ImageDraw.ImageDraw,
                          ashi_events: List[Dict], sindi_events: List[Dict]):
         """Render calendar on left side."""
         today = datetime.now()
-        all_events = ashi_events + sindi_events
+        by_date = index_events(ashi_events, sindi_events, self._starts)
         
         x_start = 20
         y_start = 15
         
         # Title
-        draw.text((x_start, y_start), "CALENDAR", font=self.font_lg, 
-                 fill=self.COLORS["black"])
+        self._glyphs.stamp(img, (x_start, y_start), "CALENDAR", self.PALETTE_INDEX["black"], self.font_lg)
         
         y = y_start + 30
         
         # Show today + next 3 days
         for day_offset in range(0, 4):
             check_date = today + timedelta(days=day_offset)
-            day_events = self._get_events_by_date(all_events, ashi_events, check_date)
+            day_events = by_date.get(check_date.date(), [])
             
             if day_offset == 0:
                 day_label = "TODAY"
             else:
-                day_label = check_date.strftime("%a").upper()
+                day_label = _DAYNAMES[check_date.weekday()]
             
-            day_label += " " + check_date.strftime("%m/%d")
+            day_label += f" {check_date.month:02d}/{check_date.day:02d}"
             
-            draw.text((x_start, y), day_label, font=self.font_sm, 
-                     fill=self.COLORS["black"])
+            self._glyphs.stamp(img, (x_start, y), day_label, self.PALETTE_INDEX["black"], self.font_sm)
             y += 20
             
             # Show events (max 2 per day)
             if day_events:
-                for evt in day_events[:2]:
+                for _, evt, is_ashi in day_events[:2]:
                     time_str = self._format_time(evt)
                     # Use 'summary' from Google Calendar API, not 'title'
                     title = evt.get('summary') or evt.get('title') or 'Untitled'
                     title = title[:25]
-                    color = self.COLORS["ashi"] if evt in ashi_events else self.COLORS["sindi"]
+                    color = self.PALETTE_INDEX["ashi"] if is_ashi else self.PALETTE_INDEX["sindi"]
                     
-                    name = "Ashi" if evt in ashi_events else "Sindi"
-                    draw.text((x_start + 10, y), f"{time_str}", font=self.font_xs,
-                             fill=self.COLORS["dark_grey"])
-                    draw.text((x_start + 50, y), f"{title}", font=self.font_xs, 
-                             fill=color)
-                    draw.text((self.mid_x - 40, y), f"({name})", font=self.font_xs,
-                             fill=color)
+                    name = "Ashi" if is_ashi else "Sindi"
+                    # Times and owner tags repeat, so only the title is laid out here
+                    self._glyphs.stamp(img, (x_start + 10, y), time_str,
+                                       self.PALETTE_INDEX["dark_grey"], self.font_xs)
+                    draw.text((x_start + 50, y), title, font=self.font_xs, fill=color)
+                    self._glyphs.stamp(img, (self.mid_x - 40, y), f"({name})", color, self.font_xs)
                     y += 16
             else:
-                draw.text((x_start + 10, y), "No events", font=self.font_xs,
-                         fill=self.COLORS["grey"])
+                self._glyphs.stamp(img, (x_start + 10, y), "No events", self.PALETTE_INDEX["grey"], self.font_xs)
                 y += 16
             
             y += 4  # Space between days
     
-    def _render_weather(self, draw: ImageDraw.ImageDraw, 
+    def _render_weather(self, img: Image.Image, draw: ImageDraw.ImageDraw,
                         weather: Optional[Dict]):
         """Render weather on top right."""
         x_start = self.mid_x + 15
         y_start = 15
         
-        draw.text((x_start, y_start), "WEATHER", font=self.font_lg,
-                 fill=self.COLORS["black"])
+        self._glyphs.stamp(img, (x_start, y_start), "WEATHER", self.PALETTE_INDEX["black"], self.font_lg)
         
         if not weather:
-            draw.text((x_start, y_start + 35), "No data", font=self.font_sm,
-                     fill=self.COLORS["grey"])
+            self._glyphs.stamp(img, (x_start, y_start + 35), "No data", self.PALETTE_INDEX["grey"], self.font_sm)
             return
         
         y = y_start + 35
@@ -167,38 +184,36 @@ class DashboardRenderer:
         temp = weather.get('temp', '--')
         temp_str = f"{temp}°"
         draw.text((x_start, y), temp_str, font=self.font_xl,
-                 fill=self.COLORS["black"])
+                 fill=self.PALETTE_INDEX["black"])
         y += 40
         
         # Condition
         condition = weather.get('condition', 'Unknown')[:20]
         draw.text((x_start, y), condition, font=self.font_sm,
-                 fill=self.COLORS["dark_grey"])
+                 fill=self.PALETTE_INDEX["dark_grey"])
         y += 20
         
         # UV Index
         uv = weather.get('uv_index', '--')
         draw.text((x_start, y), f"UV: {uv}", font=self.font_xs,
-                 fill=self.COLORS["dark_grey"])
+                 fill=self.PALETTE_INDEX["dark_grey"])
         
         # Location
         location = weather.get('location', '')[:15]
         if location:
             draw.text((x_start + 80, y), location, font=self.font_xs,
-                     fill=self.COLORS["grey"])
+                     fill=self.PALETTE_INDEX["grey"])
     
-    def _render_stocks(self, draw: ImageDraw.ImageDraw,
+    def _render_stocks(self, img: Image.Image, draw: ImageDraw.ImageDraw,
                        stocks: Optional[Dict]):
         """Render stocks on bottom right."""
         x_start = self.mid_x + 15
         y_start = 250
         
-        draw.text((x_start, y_start), "STOCKS", font=self.font_lg,
-                 fill=self.COLORS["black"])
+        self._glyphs.stamp(img, (x_start, y_start), "STOCKS", self.PALETTE_INDEX["black"], self.font_lg)
         
         if not stocks:
-            draw.text((x_start, y_start + 35), "No data", font=self.font_sm,
-                     fill=self.COLORS["grey"])
+            self._glyphs.stamp(img, (x_start, y_start + 35), "No data", self.PALETTE_INDEX["grey"], self.font_sm)
             return
         
         y = y_start + 35
@@ -210,13 +225,13 @@ class DashboardRenderer:
             change_pct = data.get('change_pct', 0)
             
             # Color based on change
-            color = self.COLORS["green"] if change >= 0 else self.COLORS["red"]
+            color = self.PALETTE_INDEX["green"] if change >= 0 else self.PALETTE_INDEX["red"]
             
             # Ticker + price
             draw.text((x_start, y), ticker, font=self.font_sm,
-                     fill=self.COLORS["black"])
+                     fill=self.PALETTE_INDEX["black"])
             draw.text((x_start + 80, y), f"${price}", font=self.font_sm,
-                     fill=self.COLORS["black"])
+                     fill=self.PALETTE_INDEX["black"])
             
             # Change %
             sign = "+" if change >= 0 else ""
@@ -226,57 +241,24 @@ class DashboardRenderer:
             
             y += 22
     
-    def _get_events_by_date(self, all_events: List[Dict], ashi_events: List[Dict],
-                            target_date: datetime) -> List[Dict]:
-        """Get events for a date, sorted by time."""
-        day_events = []
-        for e in all_events:
-            try:
-                if isinstance(e.get('start'), dict):
-                    start_str = e['start'].get('dateTime', '')
-                else:
-                    start_str = e.get('start', '')
-                
-                if not start_str:
-                    continue
-                
-                evt_dt = datetime.fromisoformat(start_str)
-                if evt_dt.date() == target_date.date():
-                    day_events.append(e)
-            except (ValueError, KeyError, TypeError):
-                continue
+    def _blank_canvas(self) -> Image.Image:
+        """Get the renderer's canvas, cleared to white.
         
-        try:
-            day_events.sort(key=lambda e: self._parse_datetime(e))
-        except:
-            pass
-        
-        return day_events
-    
-    def _parse_datetime(self, event: Dict) -> datetime:
-        """Parse event datetime."""
-        if isinstance(event.get('start'), dict):
-            start_str = event['start'].get('dateTime', '')
-        else:
-            start_str = event.get('start', '')
-        
-        if start_str:
-            try:
-                return datetime.fromisoformat(start_str)
-            except:
-                pass
-        
-        return datetime.min
+        The same image is returned by every render and overwritten by the next
+        one; callers must not modify it and should copy a frame they keep.
+        """
+        self._canvas = blank_canvas(self._canvas, "P", (self.width, self.height),
+                                    self.PALETTE_INDEX["white"], self.PALETTE)
+        if self._draw is None:
+            self._draw = ImageDraw.Draw(self._canvas)
+        return self._canvas
     
     def _format_time(self, event: Dict) -> str:
         """Format time as HH:MM."""
-        try:
-            dt = self._parse_datetime(event)
-            if dt != datetime.min:
-                return dt.strftime("%H:%M")
-        except:
-            pass
-        return "--:--"
+        dt = self._starts(event)
+        if dt is datetime.min:
+            return "--:--"
+        return f"{dt.hour:02d}:{dt.minute:02d}"
     
     def save(self, img: Image.Image, path: str = "dashboard.png"):
         """Save image."""
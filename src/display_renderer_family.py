@@ -5,8 +5,23 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from PIL import Image, ImageDraw, ImageFont
 
+from src.render_helpers import EventStarts, GlyphCache, blank_canvas, index_events, load_font
+
 logger = logging.getLogger(__name__)
 
+DEJAVU = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+DEJAVU_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+# Upper-case %a / %b names, indexed by weekday() and month - 1
+_DAYNAMES = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+_MONTHNAMES = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+               "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+
+
+def _day_heading(day: datetime) -> str:
+    """Format a day as e.g. "FRI, FEB 10", without strftime's locale lookup."""
+    return f"{_DAYNAMES[day.weekday()]}, {_MONTHNAMES[day.month - 1]} {day.day:02d}"
+
 
 class FamilyCalendarRenderer:
     """Renders calendar in family-friendly 'smart display' format.
@@ -27,18 +42,35 @@ class FamilyCalendarRenderer:
         "dark_grey": (100, 100, 100),
     }
     
-    def __init__(self, width: int = 800, height: int = 480):
-        """Initialize renderer."""
+    def __init__(self, width: int = 800, height: int = 480, color_mode: str = "red"):
+        """Initialize renderer.
+        
+        Args:
+            width: Display width in pixels
+            height: Display height in pixels
+            color_mode: 'red' for red/greyscale, 'bw' for black/white
+        """
         self.width = width
         self.height = height
+        self.color_mode = color_mode
+        
+        # Canvas mode and the fill for each colour name, resolved once per mode
+        if self.color_mode == "bw":
+            # 1-bit canvas, the panel's native format: 0 is black, 1 is white;
+            # greys and red fall back to black so nothing is lost to dithering
+            self._mode = "1"
+            self._fills = {name: 1 if name == "white" else 0 for name in self.COLORS}
+        else:
+            self._mode = "RGB"
+            self._fills = dict(self.COLORS)
         
         # Load fonts
         try:
-            self.font_xl = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)  # Reduced from 36
-            self.font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 18)
-            self.font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-            self.font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11)
-            self.font_tiny = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 8)
+            self.font_xl = load_font(DEJAVU_BOLD, 24)  # Reduced from 36
+            self.font_large = load_font(DEJAVU_BOLD, 18)
+            self.font_medium = load_font(DEJAVU, 14)
+            self.font_small = load_font(DEJAVU, 11)
+            self.font_tiny = load_font(DEJAVU, 8)
         except (OSError, AttributeError):
             # Fallback
             self.font_xl = ImageFont.load_default()
@@ -46,6 +78,15 @@ class FamilyCalendarRenderer:
             self.font_medium = ImageFont.load_default()
             self.font_small = ImageFont.load_default()
             self.font_tiny = ImageFont.load_default()
+        
+        # Masks for labels and event times, expired each day; antialiased on RGB
+        self._glyphs = GlyphCache("1" if self._mode == "1" else "L")
+        # Parsed start per event for the render in progress
+        self._starts = EventStarts()
+        
+        # Canvas reused by every render
+        self._canvas: Optional[Image.Image] = None
+        self._draw: Optional[ImageDraw.ImageDraw] = None
     
     def render(self, ashi_events: List[Dict], sindi_events: List[Dict],
                update_time: Optional[datetime] = None) -> Image.Image:
@@ -57,66 +98,69 @@ class FamilyCalendarRenderer:
             update_time: Last update timestamp
             
         Returns:
-            PIL Image (800x480)
+            PIL Image (800x480), the shared canvas (see _blank_canvas)
         """
-        img = Image.new("RGB", (self.width, self.height), self.COLORS["white"])
-        draw = ImageDraw.Draw(img)
+        self._starts.reset()
+        img = self._blank_canvas()
+        draw = self._draw
         
         today = datetime.now()
-        all_events = ashi_events + sindi_events
+        by_date = index_events(ashi_events, sindi_events, self._starts)
+        self._glyphs.expire(today.date())
+        stamp = self._glyphs.stamp
         
         # ===== HEADER: TODAY'S DATE (COMPACT & READABLE) =====
-        today_str = today.strftime("%a, %b %d").upper()  # "FRI, FEB 10" instead of full month
-        draw.text((20, 10), today_str, font=self.font_xl, fill=self.COLORS["black"])
+        today_str = _day_heading(today)  # "FRI, FEB 10" instead of full month
+        stamp(img, (20, 10), today_str, self._fills["black"], self.font_xl)
         
         # Divider
-        draw.line([(20, 40), (self.width - 20, 40)], fill=self.COLORS["grey"], width=2)
+        draw.line([(20, 40), (self.width - 20, 40)], fill=self._fills["grey"], width=2)
         
         # ===== SECTION 1: TODAY'S EVENTS =====
         y = 50
-        draw.text((20, y), "TODAY", font=self.font_large, fill=self.COLORS["black"])
+        stamp(img, (20, y), "TODAY", self._fills["black"], self.font_large)
         y += 25
         
-        today_events = self._get_events_by_date(all_events, ashi_events, today)
+        today_events = by_date.get(today.date(), [])
         
         if today_events:
-            for evt in today_events[:4]:
+            for _, evt, is_ashi in today_events[:4]:
                 time_str = self._format_time(evt)
                 title = evt.get('summary') or evt.get('title') or 'Untitled'
                 title = title[:45]
-                color = self.COLORS["red"] if evt in ashi_events else self.COLORS["black"]
+                color = self._fills["red"] if is_ashi else self._fills["black"]
                 
-                draw.text((30, y), time_str, font=self.font_small, fill=self.COLORS["dark_grey"])
+                stamp(img, (30, y), time_str, self._fills["dark_grey"], self.font_small)
                 draw.text((85, y), title, font=self.font_small, fill=color)
                 y += 19
         else:
-            draw.text((30, y), "No events", font=self.font_small, fill=self.COLORS["grey"])
+            stamp(img, (30, y), "No events", self._fills["grey"], self.font_small)
             y += 19
         
         # ===== SECTION 2: UPCOMING DAYS =====
         y += 8
-        draw.line([(20, y), (self.width - 20, y)], fill=self.COLORS["light_grey"], width=1)
+        draw.line([(20, y), (self.width - 20, y)], fill=self._fills["light_grey"], width=1)
         y += 8
-        draw.text((20, y), "UPCOMING", font=self.font_large, fill=self.COLORS["black"])
+        stamp(img, (20, y), "UPCOMING", self._fills["black"], self.font_large)
         y += 28
         
         # Show next 6 days
         for day_offset in range(1, 7):
             check_date = today + timedelta(days=day_offset)
-            day_events = self._get_events_by_date(all_events, ashi_events, check_date)
+            day_events = by_date.get(check_date.date(), [])
             
             if day_events:
                 # Day label
-                day_str = check_date.strftime("%a, %b %d").upper()
-                draw.text((20, y), day_str, font=self.font_medium, fill=self.COLORS["black"])
+                day_str = _day_heading(check_date)
+                stamp(img, (20, y), day_str, self._fills["black"], self.font_medium)
                 y += 20
                 
                 # Events (max 2 per day)
-                for evt in day_events[:2]:
+                for _, evt, is_ashi in day_events[:2]:
                     time_str = self._format_time(evt)
                     title = evt.get('summary') or evt.get('title') or 'Untitled'
                     title = title[:40]
-                    color = self.COLORS["red"] if evt in ashi_events else self.COLORS["black"]
+                    color = self._fills["red"] if is_ashi else self._fills["black"]
                     
                     draw.text((35, y), f"{time_str} - {title}", font=self.font_small, fill=color)
                     y += 17
@@ -126,69 +170,35 @@ class FamilyCalendarRenderer:
         
         # ===== FOOTER: Legend & Update Time =====
         y = self.height - 28
-        draw.line([(20, y), (self.width - 20, y)], fill=self.COLORS["light_grey"], width=1)
+        draw.line([(20, y), (self.width - 20, y)], fill=self._fills["light_grey"], width=1)
         y += 4
         
-        draw.text((20, y), "Red = Ashi  •  Black = Sindi", font=self.font_tiny, fill=self.COLORS["dark_grey"])
+        stamp(img, (20, y), "Red = Ashi  •  Black = Sindi", self._fills["dark_grey"], self.font_tiny)
         
         if update_time:
-            update_str = f"Updated: {update_time.strftime('%H:%M')}"
-            draw.text((self.width - 170, y), update_str, font=self.font_tiny, fill=self.COLORS["grey"])
+            update_str = f"Updated: {update_time.hour:02d}:{update_time.minute:02d}"
+            draw.text((self.width - 170, y), update_str, font=self.font_tiny, fill=self._fills["grey"])
         
         return img
     
-    def _get_events_by_date(self, all_events: List[Dict], ashi_events: List[Dict],
-                            target_date: datetime) -> List[Dict]:
-        """Get events for a date, sorted by time."""
-        day_events = []
-        for e in all_events:
-            try:
-                if isinstance(e.get('start'), dict):
-                    start_str = e['start'].get('dateTime', '')
-                else:
-                    start_str = e.get('start', '')
-                
-                if not start_str:
-                    continue
-                
-                evt_dt = datetime.fromisoformat(start_str)
-                if evt_dt.date() == target_date.date():
-                    day_events.append(e)
-            except (ValueError, KeyError, TypeError):
-                continue
-        
-        # Sort by start time
-        try:
-            day_events.sort(key=lambda e: self._parse_datetime(e))
-        except:
-            pass
-        
-        return day_events
-    
-    def _parse_datetime(self, event: Dict) -> datetime:
-        """Parse event datetime."""
-        if isinstance(event.get('start'), dict):
-            start_str = event['start'].get('dateTime', '')
-        else:
-            start_str = event.get('start', '')
-        
-        if start_str:
-            try:
-                return datetime.fromisoformat(start_str)
-            except:
-                pass
+    def _blank_canvas(self) -> Image.Image:
+        """Get the renderer's canvas, cleared to white.
         
-        return datetime.min
+        The same image is returned by every render and overwritten by the next
+        one; callers must not modify it and should copy a frame they keep.
+        """
+        self._canvas = blank_canvas(self._canvas, self._mode, (self.width, self.height),
+                                    self._fills["white"])
+        if self._draw is None:
+            self._draw = ImageDraw.Draw(self._canvas)
+        return self._canvas
     
     def _format_time(self, event: Dict) -> str:
         """Format time as HH:MM."""
-        try:
-            dt = self._parse_datetime(event)
-            if dt != datetime.min:
-                return dt.strftime("%H:%M")
-        except:
-            pass
-        return "--:--"
+        dt = self._starts(event)
+        if dt is datetime.min:
+            return "--:--"
+        return f"{dt.hour:02d}:{dt.minute:02d}"
     
     def save(self, img: Image.Image, path: str = "display.png"):
         """Save image."""
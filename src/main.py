@@ -119,7 +119,8 @@ class CalendarDashboard:
         else:  # MODE_FAMILY
             self.renderer = FamilyCalendarRenderer(
                 config.DISPLAY_WIDTH,
-                config.DISPLAY_HEIGHT
+                config.DISPLAY_HEIGHT,
+                config.DISPLAY_COLOR_MODE
             )
         
         self.display = get_display_driver(use_hardware=True)
@@ -157,6 +158,11 @@ class CalendarDashboard:
             else:
                 logger.warning("Sindi calendar: offline (using cache)")
             
+            # Monthly: drop past events, then reclaim their pages
+            if self.cache.maintenance_due():
+                self.cache.clear_old_events()
+                self.cache.maintenance()
+            
             # Fetch stocks and weather if needed
             stocks = None
             weather = None
@@ -268,6 +274,8 @@ def main():
                        help="Stock tickers to show in dashboard mode (e.g., --stocks AAPL MSFT)")
     args = parser.parse_args()
     
+    config.setup_logging()
+    
     logger.info("=" * 60)
     logger.info("E-Paper Calendar Dashboard v0.1.0")
     logger.info(f"Start time: {datetime.now().isoformat()}")
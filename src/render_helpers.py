@@ -0,0 +1,169 @@
+"""Drawing and event helpers shared by the display renderers."""
+
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from PIL import Image, ImageDraw, ImageFont
+
+# A fill in any canvas mode: palette index or 1-bit value, or an RGB triple
+Fill = Union[int, Tuple[int, int, int]]
+
+
+@lru_cache(maxsize=None)
+def load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Open a TrueType font once per (path, size), shared by every renderer.
+    
+    Uses Pillow's basic layout: the labels here are short left-to-right
+    strings, so Raqm/HarfBuzz shaping (picked by default when libraqm is
+    installed) would only add per-call layout cost.
+    """
+    return ImageFont.truetype(path, size, layout_engine=ImageFont.Layout.BASIC)
+
+
+def blank_canvas(canvas: Optional[Image.Image], mode: str, size: Tuple[int, int],
+                 fill: Fill, palette: Optional[Sequence[int]] = None) -> Image.Image:
+    """Clear a renderer's persistent canvas to fill, creating it on first use.
+    
+    Args:
+        canvas: The canvas from the previous render, or None
+        mode: Image mode to create the canvas in
+        size: (width, height) of the canvas
+        fill: Background fill in that mode
+        palette: Palette to attach to a new "P" canvas
+    
+    Returns:
+        canvas itself, cleared, or the newly created image
+    """
+    if canvas is None:
+        canvas = Image.new(mode, size, fill)
+        if palette is not None:
+            canvas.putpalette(palette)
+    else:
+        canvas.paste(fill, (0, 0) + size)
+    return canvas
+
+
+class GlyphCache:
+    """Pre-rendered text masks, pasted in place of draw.text().
+    
+    Masks are 1-bit for paletted and 1-bit canvases (where text is not
+    antialiased) and "L" for RGB ones, so a stamp gives the same pixels
+    draw.text() would, without FreeType layout on every call.
+    """
+    
+    def __init__(self, mask_mode: str = "1"):
+        """Initialize an empty cache.
+        
+        Args:
+            mask_mode: "1" for paletted and 1-bit canvases, "L" for RGB ones
+        """
+        self._mask_mode = mask_mode
+        self._ink = 1 if mask_mode == "1" else 255
+        # (mask, offset from the text origin) per (text, font)
+        self._glyphs: Dict[Tuple[str, ImageFont.ImageFont], Tuple[Image.Image, Tuple[int, int]]] = {}
+        self._day: Optional[date] = None
+    
+    def expire(self, today: date):
+        """Drop every mask when the day changes, so dated labels don't accumulate."""
+        if today != self._day:
+            self._glyphs.clear()
+            self._day = today
+    
+    def glyph(self, text: str, font: ImageFont.ImageFont) -> Tuple[Image.Image, Tuple[int, int]]:
+        """Get the mask of text and its offset from the text origin."""
+        key = (text, font)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            # Draw with a margin (glyphs can overhang their bbox), then trim
+            left, top, right, bottom = font.getbbox(text)
+            pad = 2
+            mask = Image.new(self._mask_mode, (right - left + 2 * pad, bottom - top + 2 * pad), 0)
+            ImageDraw.Draw(mask).text((pad - left, pad - top), text, fill=self._ink, font=font)
+            box = mask.getbbox() or (0, 0, 0, 0)
+            offset = (left - pad + box[0], top - pad + box[1])
+            glyph = self._glyphs[key] = (mask.crop(box), offset)
+        return glyph
+    
+    def stamp(self, img: Image.Image, xy: Tuple[int, int], text: str,
+              fill: Fill, font: ImageFont.ImageFont):
+        """Draw text at xy by pasting its cached mask."""
+        mask, (dx, dy) = self.glyph(text, font)
+        img.paste(fill, (xy[0] + dx, xy[1] + dy), mask)
+
+
+def event_start(event: Dict) -> Tuple[str, bool]:
+    """An event's ISO start string and whether it has a time of day.
+    
+    All-day events give their date and False; a plain string start is
+    taken as an ISO date-time.
+    """
+    start = event.get("start") or {}
+    if isinstance(start, str):
+        return start, True
+    date_time = start.get("dateTime")
+    if date_time:
+        return date_time, True
+    return start.get("date", ""), False
+
+
+class EventStarts:
+    """Parsed start of each event, memoized by id() for one render.
+    
+    ids are only unique while the render's events are alive, so call
+    reset() at the start of every render.
+    """
+    
+    def __init__(self):
+        self._parsed: Dict[int, datetime] = {}
+    
+    def reset(self):
+        """Forget the previous render's events."""
+        self._parsed = {}
+    
+    def __call__(self, event: Dict) -> datetime:
+        """Start of a timed event; datetime.min for all-day or unparseable ones."""
+        dt = self._parsed.get(id(event))
+        if dt is not None:
+            return dt
+        
+        start_str, has_time = event_start(event)
+        
+        dt = datetime.min
+        if has_time:
+            try:
+                dt = datetime.fromisoformat(start_str)
+            except (ValueError, TypeError):
+                pass
+        
+        self._parsed[id(event)] = dt
+        return dt
+
+
+def index_events(ashi_events: List[Dict], sindi_events: List[Dict],
+                 parse: Callable[[Dict], datetime]
+                 ) -> Dict[date, List[Tuple[datetime, Dict, bool]]]:
+    """Bucket timed events by start date in one pass over both calendars.
+    
+    Args:
+        ashi_events: Ashi's events
+        sindi_events: Sindi's events
+        parse: Event start parser, e.g. an EventStarts
+    
+    Returns:
+        Dict of date -> list of (start, event, is_ashi), sorted by start
+    """
+    by_date: Dict[date, List[Tuple[datetime, Dict, bool]]] = {}
+    for events, is_ashi in ((ashi_events, True), (sindi_events, False)):
+        for e in events:
+            evt_dt = parse(e)
+            if evt_dt is not datetime.min:
+                by_date.setdefault(evt_dt.date(), []).append((evt_dt, e, is_ashi))
+    
+    for day_events in by_date.values():
+        try:
+            day_events.sort(key=itemgetter(0))
+        except TypeError:
+            pass  # Offset-aware and naive starts don't compare; keep fetch order
+    
+    return by_date
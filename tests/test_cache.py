@@ -14,6 +14,7 @@ def cache():
         db_path = Path(tmpdir) / "test.db"
         cache = CacheManager(str(db_path))
         yield cache
+        cache.close()
 
 def test_cache_init(cache):
     """Test cache initialization."""
@@ -87,3 +88,198 @@ def test_clear_all(cache):
     
     cache.clear_all()
     assert cache.get_event_count() == 0
+
+def test_store_events_batch(cache):
+    """Test storing a batch of events, skipping events without an ID."""
+    now = datetime.now()
+    events = [
+        {
+            "id": f"event{i}",
+            "summary": f"Event {i}",
+            "start": {"dateTime": (now + timedelta(hours=i)).isoformat()},
+            "end": {"dateTime": (now + timedelta(hours=i + 1)).isoformat()},
+        }
+        for i in range(50)
+    ]
+    events.append({"summary": "No ID", "start": {"date": "2026-01-01"}, "end": {"date": "2026-01-02"}})
+    
+    count = cache.store_events("calendar1", events)
+    assert count == 50
+    assert cache.get_event_count("calendar1") == 50
+
+def test_wal_journal_mode(cache):
+    """Test cache database uses write-ahead logging."""
+    mode = cache._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+def test_get_events_filters(cache):
+    """Test calendar and date-range filters, including open-ended ranges."""
+    events = [
+        {"id": "a", "summary": "A", "start": {"dateTime": "2026-03-01T09:00:00"},
+         "end": {"dateTime": "2026-03-01T10:00:00"}},
+        {"id": "b", "summary": "B", "start": {"dateTime": "2026-03-05T09:00:00"},
+         "end": {"dateTime": "2026-03-05T10:00:00"}},
+    ]
+    cache.store_events("calendar1", events)
+    cache.store_events("calendar2", [
+        {"id": "c", "summary": "C", "start": {"date": "2026-03-03"}, "end": {"date": "2026-03-04"}},
+    ])
+    
+    assert [e["id"] for e in cache.get_events()] == ["a", "c", "b"]
+    assert [e["id"] for e in cache.get_events("calendar1")] == ["a", "b"]
+    assert [e["id"] for e in cache.get_events(start_date="2026-03-02")] == ["c", "b"]
+    assert [e["id"] for e in cache.get_events(end_date="2026-03-04")] == ["a", "c"]
+    assert [e["id"] for e in cache.get_events(
+        "calendar1", "2026-03-02", "2026-03-31")] == ["b"]
+
+def test_iter_events(cache):
+    """Test streaming events from cache."""
+    events = [
+        {
+            "id": "event1",
+            "summary": "Test Event",
+            "start": {"dateTime": datetime.now().isoformat()},
+            "end": {"dateTime": (datetime.now() + timedelta(hours=1)).isoformat()},
+        }
+    ]
+    
+    cache.store_events("calendar1", events)
+    iterator = cache.iter_events("calendar1")
+    
+    assert next(iterator)["summary"] == "Test Event"
+    assert next(iterator, None) is None
+
+def test_get_events_lite(cache):
+    """Test retrieving lightweight event rows."""
+    events = [
+        {
+            "id": "event1",
+            "summary": "Lite Event",
+            "start": {"date": "2026-03-01"},
+            "end": {"date": "2026-03-02"},
+            "colorId": "4",
+        }
+    ]
+    
+    cache.store_events("calendar1", events)
+    rows = cache.get_events_lite("calendar1")
+    
+    assert len(rows) == 1
+    assert rows[0].summary == "Lite Event"
+    assert rows[0].start_time == "2026-03-01"
+    assert rows[0].all_day == 1
+    assert rows[0].color == "4"
+
+def test_sync_token_and_delete(cache):
+    """Test sync token storage and deleting cancelled events."""
+    assert cache.get_sync_token("calendar1") is None
+    
+    cache.set_sync_token("calendar1", "token-1")
+    assert cache.get_sync_token("calendar1") == "token-1"
+    assert cache.get_sync_token("calendar1", max_age=-1) is None
+    
+    cache.set_sync_token("calendar1", None)
+    assert cache.get_sync_token("calendar1") is None
+    
+    cache.store_events("calendar1", [
+        {"id": "event1", "summary": "Test", "start": {"date": "2026-03-01"}, "end": {"date": "2026-03-02"}},
+    ])
+    assert cache.delete_events("calendar1", ["event1", "missing"]) == 1
+    assert cache.get_event_count() == 0
+
+
+def test_maintenance(cache):
+    """Test VACUUM runs once per interval."""
+    assert cache.maintenance() is True
+    assert cache.maintenance() is False
+    assert cache.maintenance(vacuum_interval=-1) is True
+
+
+def test_maintenance_due(cache):
+    """Test maintenance is due until it has run, then again after the interval."""
+    assert cache.maintenance_due() is True
+    cache.maintenance()
+    assert cache.maintenance_due() is False
+    assert cache.maintenance_due(vacuum_interval=-1) is True
+
+
+def test_maintenance_skipped_inside_batch(cache):
+    """Test VACUUM is not attempted while a transaction is open."""
+    with cache.batch():
+        assert cache.maintenance(vacuum_interval=-1) is False
+    assert cache.maintenance(vacuum_interval=-1) is True
+
+
+def test_clear_old_events(cache):
+    """Test only events older than the cutoff are deleted."""
+    old = (datetime.now() - timedelta(days=10)).date().isoformat()
+    recent = datetime.now().date().isoformat()
+    cache.store_events("calendar1", [
+        {"id": "old", "summary": "Old", "start": {"date": old}, "end": {"date": old}},
+        {"id": "recent", "summary": "Recent", "start": {"date": recent}, "end": {"date": recent}},
+    ])
+    
+    assert cache.clear_old_events(days=7) == 1
+    assert [e["id"] for e in cache.get_events()] == ["recent"]
+
+
+def test_events_hash(cache):
+    """Test per-calendar events hash storage."""
+    assert cache.get_events_hash("calendar1") is None
+    
+    cache.set_events_hash("calendar1", "abc123")
+    assert cache.get_events_hash("calendar1") == "abc123"
+    assert cache.get_events_hash("calendar2") is None
+
+
+def test_get_events_order_by(cache):
+    """Test start-time ordering is done by the query."""
+    cache.store_events("calendar1", [
+        {"id": "late", "summary": "Late", "start": {"dateTime": "2026-03-01T15:00:00"}, "end": {"dateTime": "2026-03-01T16:00:00"}},
+        {"id": "early", "summary": "Early", "start": {"dateTime": "2026-03-01T09:00:00"}, "end": {"dateTime": "2026-03-01T10:00:00"}},
+    ])
+    
+    assert [e["id"] for e in cache.get_events(order_by="start")] == ["early", "late"]
+    assert len(cache.get_events(order_by=None)) == 2
+    
+    with pytest.raises(ValueError):
+        cache.get_events(order_by="summary")
+
+
+def test_batch_single_transaction(cache):
+    """Test writes inside batch() commit together, or not at all."""
+    event = {"id": "event1", "summary": "Test", "start": {"date": "2026-03-01"}, "end": {"date": "2026-03-02"}}
+    
+    with cache.batch():
+        cache.store_events("calendar1", [event])
+        cache.store_events("calendar2", [dict(event, id="event2")])
+        assert cache._conn.in_transaction
+    assert not cache._conn.in_transaction
+    assert cache.get_event_count() == 2
+    
+    with pytest.raises(RuntimeError):
+        with cache.batch():
+            cache.store_events("calendar3", [dict(event, id="event3")])
+            raise RuntimeError("fetch failed")
+    assert cache.get_event_count() == 2
+
+
+def test_mark_updated(cache):
+    """Test a fetch that stored nothing still resets the cache age."""
+    assert cache.get_cache_age() is None
+    cache.mark_updated()
+    assert cache.get_cache_age() <= 1
+
+
+def test_savepoint_rolls_back_only_its_writes(cache):
+    """Test a failed savepoint inside a batch discards just its own writes."""
+    event = {"id": "event1", "summary": "Test", "start": {"date": "2026-03-01"}, "end": {"date": "2026-03-02"}}
+    with cache.batch():
+        cache.store_events("calendar1", [event])
+        with pytest.raises(RuntimeError):
+            with cache.savepoint():
+                cache.store_events("calendar2", [dict(event, id="event2")])
+                raise RuntimeError("boom")
+    
+    assert cache.get_event_count("calendar1") == 1
+    assert cache.get_event_count("calendar2") == 0
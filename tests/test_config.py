@@ -1,5 +1,6 @@
 """Tests for configuration."""
 
+import logging
 import pytest
 import os
 from pathlib import Path
@@ -31,3 +32,18 @@ def test_calendar_ids_configured():
     """Test that calendar IDs are in config (might be placeholders)."""
     assert config.ASHI_CALENDAR_ID  # Should not be empty in .env
     assert config.SINDI_CALENDAR_ID  # Should not be empty in .env
+
+def test_setup_logging_idempotent(tmp_path, monkeypatch):
+    """Test logging is configured once and on demand."""
+    monkeypatch.setattr(config, "LOG_FILE", tmp_path / "calendar.log")
+    root = logging.getLogger()
+    before = list(root.handlers)
+    config.setup_logging.cache_clear()
+    try:
+        assert config.setup_logging() is config.setup_logging()
+    finally:
+        config.setup_logging.cache_clear()
+        for handler in root.handlers[:]:
+            if handler not in before:
+                root.removeHandler(handler)
+                handler.close()
@@ -4,7 +4,11 @@ import pytest
 from datetime import datetime, timedelta
 from PIL import Image
 
-from src.display_renderer import DisplayRenderer
+from src.display_renderer import AtAGlanceRenderer, DisplayRenderer, _prepare_events
+from src.display_renderer_calendar_weather import CalendarWeatherRenderer
+from src.display_renderer_dashboard import DashboardRenderer
+from src.display_renderer_family import FamilyCalendarRenderer
+from src.render_helpers import EventStarts, index_events
 
 @pytest.fixture
 def renderer():
@@ -23,7 +27,7 @@ def test_render_empty(renderer):
     
     assert isinstance(img, Image.Image)
     assert img.size == (800, 480)
-    assert img.mode == "RGB"
+    assert img.mode == "P"  # paletted: white, black, red and greys
 
 def test_render_with_events(renderer):
     """Test rendering with events."""
@@ -65,3 +69,298 @@ def test_bw_mode():
     img = renderer.render([], [])
     
     assert img.mode == "1"  # 1-bit black & white
+
+def test_fonts_loaded_on_first_use(renderer):
+    """Test fonts are not opened until a render draws with them."""
+    assert "font_large" not in vars(renderer)
+    renderer.render([], [])
+    
+    assert "font_large" in vars(renderer)
+    assert "font_tiny" not in vars(renderer)  # never drawn with
+
+def test_fonts_shared_between_renderers(renderer):
+    """Test a second renderer reuses the already-parsed fonts."""
+    other = DisplayRenderer(800, 480, "bw")
+    
+    assert other.font_medium is renderer.font_medium
+
+def test_index_events_by_date(renderer):
+    """Test events are bucketed by start date with their dot colour."""
+    ashi = {"id": "1", "start": {"dateTime": "2026-03-02T10:00:00"}}
+    sindi = {"id": "2", "start": {"date": "2026-03-02"}}
+    
+    by_date = renderer._index_events_by_date([ashi], [sindi])
+    
+    assert by_date == {"2026-03-02": [(ashi, "red"), (sindi, "black")]}
+
+def test_prepare_events_parses_start_once():
+    """Test at-a-glance events carry a parsed start and skip bad ones."""
+    good = {"id": "1", "start": {"dateTime": "2026-03-02T10:00:00"}}
+    iso = {"id": "2", "start": "2026-03-03T09:30:00"}
+    all_day = {"id": "3", "start": {"date": "2026-03-04"}}
+    broken = {"id": "4", "start": {"dateTime": "not a time"}}
+    
+    prepared = _prepare_events([good, iso, all_day, broken], "ashi", EventStarts())
+    
+    assert [(p[0].hour, p[1].day, p[2]["id"], p[3]) for p in prepared] == [
+        (10, 2, "1", "ashi"),
+        (9, 3, "2", "ashi"),
+    ]
+
+def test_get_upcoming_events_sorted(renderer):
+    """Test upcoming events come back earliest first across both owners."""
+    later = {"id": "1", "start": {"dateTime": "2026-03-02T15:00:00"}}
+    all_day = {"id": "2", "start": {"date": "2026-03-02"}}
+    early = {"id": "3", "start": {"dateTime": "2026-03-02T08:00:00"}}
+    
+    upcoming = renderer._get_upcoming_events([later, early], [all_day], limit=2)
+    
+    assert upcoming == [(all_day, "sindi"), (early, "ashi")]
+
+def test_bw_mode_with_events():
+    """Test black & white mode draws event dots without RGB fills."""
+    renderer = DisplayRenderer(800, 480, "bw")
+    today = datetime.now().date().isoformat()
+    events = [{"id": "1", "summary": "Meeting", "start": {"dateTime": today + "T10:00:00"}}]
+    
+    img = renderer.render(events, events)
+    
+    assert img.mode == "1"
+
+def test_unchanged_inputs_reuse_render(renderer, monkeypatch):
+    """Test identical inputs within the same minute skip redrawing."""
+    update_time = datetime(2026, 3, 2, 9, 15, 5)
+    events = [{"id": "1", "updated": "2026-03-01T00:00:00Z", "summary": "Meeting",
+               "start": {"dateTime": "2026-03-02T10:00:00"}}]
+    first = renderer.render(events, [], update_time)
+    snapshot = first.tobytes()
+    
+    def fail(*args):
+        raise AssertionError("redrew unchanged calendar")
+    monkeypatch.setattr(renderer, "_draw_event_dots", fail)
+    second = renderer.render(events, [], update_time.replace(second=40))
+    
+    assert second is first
+    assert second.tobytes() == snapshot
+    
+    changed = [dict(events[0], updated="2026-03-02T08:00:00Z")]
+    with pytest.raises(AssertionError):
+        renderer.render(changed, [], update_time)
+
+def test_events_without_ids_invalidate_render(renderer):
+    """Test id-less events with different titles don't reuse the previous frame."""
+    update_time = datetime(2026, 3, 2, 9, 15)
+    today = datetime.now().date().isoformat()
+    dentist = [{"summary": "Dentist", "start": {"dateTime": today + "T10:00:00"}}]
+    soccer = [{"summary": "Soccer", "start": {"dateTime": today + "T10:00:00"}}]
+    
+    first = renderer.render(dentist, [], update_time).tobytes()
+    second = renderer.render(soccer, [], update_time).tobytes()
+    
+    assert second != first
+
+def test_index_events_limited_to_grid(renderer):
+    """Test the index drops days outside the grid and caps dots per day."""
+    events = [{"id": str(i), "start": {"date": "2026-03-02"}} for i in range(5)]
+    outside = {"id": "x", "start": {"date": "2026-05-01"}}
+    
+    by_date = renderer._index_events_by_date(events + [outside], [], "2026-03-01", "2026-04-11")
+    
+    assert list(by_date) == ["2026-03-02"]
+    assert len(by_date["2026-03-02"]) == renderer.MAX_DOTS
+
+def test_canvas_reused_between_renders(renderer):
+    """Test every render draws onto and returns the same canvas."""
+    update_time = datetime(2026, 3, 2, 9, 15)
+    first = renderer.render([], [], update_time)
+    canvas = renderer._canvas
+    snapshot = first.tobytes()
+    
+    events = [{"id": "1", "summary": "Meeting", "start": {"date": "2026-03-02"}}]
+    second = renderer.render(events, [], update_time)
+    
+    assert first is canvas
+    assert second is canvas
+    assert second.tobytes() != snapshot
+
+def test_at_a_glance_render():
+    """Test the at-a-glance layout renders today's and upcoming events."""
+    renderer = AtAGlanceRenderer(800, 480)
+    now = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
+    ashi_events = [{"id": "1", "summary": "Meeting", "start": {"dateTime": now.isoformat()}}]
+    sindi_events = [{"id": "2", "summary": "Dentist",
+                     "start": {"dateTime": (now + timedelta(days=3)).isoformat()}}]
+    
+    img = renderer.render(ashi_events, sindi_events, now)
+    
+    assert img.size == (800, 480)
+    assert (255, 0, 0) in {rgb for _, rgb in img.getcolors(maxcolors=1 << 16)}
+
+def test_stamped_glyphs_match_draw_text(renderer):
+    """Test cached glyph masks reproduce draw.text pixel for pixel."""
+    from PIL import ImageDraw
+    
+    for text in ("1", "28", "Wed"):
+        expected = Image.new("P", (80, 30), 0)
+        ImageDraw.Draw(expected).text((10, 5), text, fill=1, font=renderer.font_medium)
+        stamped = Image.new("P", (80, 30), 0)
+        renderer._glyphs.stamp(stamped, (10, 5), text, 1, renderer.font_medium)
+        
+        assert stamped.tobytes() == expected.tobytes()
+
+def test_calendar_weather_fonts_shared():
+    """Test calendar + weather renderers reuse the already-opened fonts."""
+    first = CalendarWeatherRenderer(800, 480)
+    second = CalendarWeatherRenderer(800, 480)
+    
+    assert second.font_sm is first.font_sm
+
+def test_background_drawn_once_per_day(renderer, monkeypatch):
+    """Test the static chrome is reused across renders on the same day."""
+    renderer.render([], [], datetime(2026, 3, 2, 9, 15))
+    
+    def fail(*args):
+        raise AssertionError("redrew static background")
+    monkeypatch.setattr(renderer, "_draw_calendar_grid", fail)
+    img = renderer.render([], [], datetime(2026, 3, 2, 9, 16))
+    
+    assert img.size == (800, 480)
+
+def test_calendar_weather_render():
+    """Test calendar + weather renders a paletted image with today's events."""
+    renderer = CalendarWeatherRenderer(800, 480)
+    now = datetime.now().replace(hour=9, minute=30, second=0, microsecond=0)
+    ashi_events = [{"id": "1", "summary": "Meeting", "start": {"dateTime": now.isoformat()}}]
+    forecast = [{"temp_high": 20, "temp_low": 12, "condition": "Sunny"}] * 3
+    
+    img = renderer.render(ashi_events, [], forecast, {"temp": 18, "condition": "Clear"}, now)
+    
+    assert img.mode == "P"
+    assert img.size == (800, 480)
+    assert renderer.PALETTE_INDEX["red"] in {index for _, index in img.getcolors()}
+
+def test_calendar_weather_reuses_unchanged_render(monkeypatch):
+    """Test calendar + weather only repaints the footer when nothing else changed."""
+    renderer = CalendarWeatherRenderer(800, 480)
+    now = datetime.now().replace(hour=9, minute=30, second=0, microsecond=0)
+    events = [{"id": "1", "updated": "2026-03-01T00:00:00Z", "summary": "Meeting",
+               "start": {"dateTime": now.isoformat()}}]
+    first = renderer.render(events, [], None, {"temp": 18}, now)
+    
+    def fail(*args):
+        raise AssertionError("redrew unchanged calendar")
+    monkeypatch.setattr(renderer, "_render_calendar", fail)
+    same = renderer.render(events, [], None, {"temp": 18}, now)
+    later = renderer.render(events, [], None, {"temp": 18}, now + timedelta(minutes=5))
+    
+    assert same is not first
+    assert same.tobytes() == first.tobytes()
+    assert later.tobytes() != first.tobytes()
+    
+    with pytest.raises(AssertionError):
+        renderer.render(events, [], None, {"temp": 19}, now)
+
+@pytest.mark.parametrize("renderer_cls, mode, background, fill", [
+    (DashboardRenderer, "P", 0, 5),
+    (FamilyCalendarRenderer, "RGB", (255, 255, 255), (100, 100, 100)),
+])
+def test_dashboard_and_family_stamps_match_draw_text(renderer_cls, mode, background, fill):
+    """Test cached label masks reproduce draw.text on each renderer's canvas mode."""
+    from PIL import ImageDraw
+    
+    renderer = renderer_cls(800, 480)
+    for text in ("TODAY", "No events", "Red = Ashi  •  Black = Sindi"):
+        expected = Image.new(mode, (600, 50), background)
+        ImageDraw.Draw(expected).text((10, 5), text, fill=fill, font=renderer.font_xl)
+        stamped = Image.new(mode, (600, 50), background)
+        renderer._glyphs.stamp(stamped, (10, 5), text, fill, renderer.font_xl)
+        
+        assert stamped.tobytes() == expected.tobytes()
+
+@pytest.mark.parametrize("renderer_cls", [DashboardRenderer, FamilyCalendarRenderer])
+def test_dashboard_and_family_fonts_shared(renderer_cls):
+    """Test dashboard and family renderers reuse the already-opened fonts."""
+    first = renderer_cls(800, 480)
+    second = renderer_cls(800, 480)
+    
+    assert second.font_xl is first.font_xl
+
+def test_index_events():
+    """Test events are bucketed by day, sorted by start and tagged with their owner."""
+    later = {"id": "1", "start": {"dateTime": "2026-03-02T15:00:00"}}
+    early = {"id": "2", "start": {"dateTime": "2026-03-02T08:00:00"}}
+    all_day = {"id": "3", "start": {"date": "2026-03-02"}}
+    
+    by_date = index_events([later], [early, all_day], EventStarts())
+    
+    day = datetime(2026, 3, 2).date()
+    assert [(evt, is_ashi) for _, evt, is_ashi in by_date[day]] == [(early, False), (later, True)]
+
+def test_event_starts_skip_unparseable():
+    """Test all-day and malformed starts parse to datetime.min instead of raising."""
+    starts = EventStarts()
+    # Kept alive together: the memo is keyed by id()
+    all_day = {"start": {"date": "2026-03-02"}}
+    malformed = {"start": {"dateTime": "garbage"}}
+    plain = {"start": "2026-03-02T08:00:00"}
+    
+    assert starts(all_day) is datetime.min
+    assert starts(malformed) is datetime.min
+    assert starts(plain) == datetime(2026, 3, 2, 8)
+
+@pytest.mark.parametrize("renderer_cls", [DashboardRenderer, FamilyCalendarRenderer])
+def test_dashboard_and_family_canvas_reused(renderer_cls):
+    """Test dashboard and family renders draw onto and return the same canvas."""
+    renderer = renderer_cls(800, 480)
+    first = renderer.render([], [])
+    canvas = renderer._canvas
+    snapshot = first.tobytes()
+    
+    now = datetime.now().replace(hour=9, minute=30, second=0, microsecond=0)
+    events = [{"id": "1", "summary": "Meeting", "start": {"dateTime": now.isoformat()}}]
+    second = renderer.render(events, [])
+    changed = second.tobytes()
+    third = renderer.render([], [])
+    
+    assert first is canvas
+    assert second is canvas
+    assert third is canvas
+    assert changed != snapshot
+    assert third.tobytes() == snapshot
+
+def test_dashboard_render():
+    """Test the dashboard renders a paletted image with Ashi's events in red."""
+    renderer = DashboardRenderer(800, 480)
+    now = datetime.now().replace(hour=9, minute=30, second=0, microsecond=0)
+    ashi_events = [{"id": "1", "summary": "Meeting", "start": {"dateTime": now.isoformat()}}]
+    stocks = {"AAPL": {"price": 190, "change": -1.5, "change_pct": -0.8}}
+    
+    img = renderer.render(ashi_events, [], stocks, {"temp": 18, "condition": "Clear"}, now)
+    
+    assert img.mode == "P"
+    assert img.size == (800, 480)
+    assert renderer.PALETTE_INDEX["ashi"] in {index for _, index in img.getcolors()}
+
+def test_family_bw_mode_renders_one_bit():
+    """Test the family view draws straight onto a 1-bit canvas in B&W mode."""
+    renderer = FamilyCalendarRenderer(800, 480, "bw")
+    now = datetime.now().replace(hour=9, minute=30, second=0, microsecond=0)
+    ashi_events = [{"id": "1", "summary": "Meeting", "start": {"dateTime": now.isoformat()}}]
+    
+    img = renderer.render(ashi_events, [], now)
+    
+    assert img.mode == "1"
+    assert img.size == (800, 480)
+    assert len(img.getcolors()) == 2  # Black text on white, no greys
+
+def test_calendar_weather_redraws_events_without_ids():
+    """Test id-less events with different titles don't reuse the cached render."""
+    renderer = CalendarWeatherRenderer(800, 480)
+    now = datetime.now().replace(hour=9, minute=30, second=0, microsecond=0)
+    dentist = [{"summary": "Dentist", "start": {"dateTime": now.isoformat()}}]
+    soccer = [{"summary": "Soccer", "start": {"dateTime": now.isoformat()}}]
+    
+    first = renderer.render(dentist, [], None, None, now).tobytes()
+    second = renderer.render(soccer, [], None, None, now).tobytes()
+    
+    assert second != first
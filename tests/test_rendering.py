@@ -20,6 +20,25 @@ class TestDefaultTemplateRendering:
         assert template.height == 480
         assert template.color_mode == "red"
 
+    def test_fonts_shared_between_instances(self):
+        """Test templates reuse cached font objects."""
+        first = DefaultTemplate()
+        second = DefaultTemplate(color_mode="bw")
+        assert first.font_small is second.font_small
+
+    def test_unchanged_content_reuses_body(self):
+        """Test re-rendering unchanged content keeps the same body pixels."""
+        template = DefaultTemplate()
+        events = [{"summary": "Meeting", "start": "10:00"}]
+        body = (0, 0, template.width, template.height - 20)
+        
+        first = template.render(events).crop(body).tobytes()
+        second = template.render(events).crop(body).tobytes()
+        changed = template.render([]).crop(body).tobytes()
+        
+        assert first == second
+        assert changed != first
+
     def test_render_with_events(self):
         """Test rendering with events."""
         template = DefaultTemplate(width=800, height=480)
@@ -53,7 +72,7 @@ class TestDefaultTemplateRendering:
         img = template.render(events, weather)
         
         assert isinstance(img, Image.Image)
-        assert img.mode in ("RGB", "1")
+        assert img.mode in ("P", "1")
 
     def test_render_without_events(self):
         """Test rendering with no events."""
@@ -74,14 +93,15 @@ class TestDefaultTemplateRendering:
         assert img.mode == "1"
 
     def test_rgb_color_mode(self):
-        """Test rendering in RGB color mode."""
+        """Test rendering in red (palette) color mode."""
         template = DefaultTemplate(color_mode="red")
         
         events = [{"summary": "Event", "start": "10:00"}]
         img = template.render(events)
         
-        # RGB images should be mode 'RGB'
-        assert img.mode == "RGB"
+        # Red-mode images are white/black/red palette images
+        assert img.mode == "P"
+        assert img.convert("RGB").getpixel((0, 0)) == (255, 255, 255)
 
 
 class TestWeatherTemplateRendering:
@@ -125,6 +145,19 @@ class TestWeatherTemplateRendering:
         
         assert isinstance(img, Image.Image)
 
+    def test_canvas_cleared_between_renders(self):
+        """Test the reused canvas does not keep the previous frame."""
+        weather = WeatherData(
+            temperature=20.0, condition="Sunny", humidity=50,
+            wind_speed=5.0, icon="☀️", timestamp=datetime.now(), location="Home"
+        )
+        template = WeatherTemplate()
+        template.render([{"summary": "Event"}], weather)
+        
+        img = template.render([])
+        
+        assert img.tobytes() == WeatherTemplate().render([]).tobytes()
+
     def test_multiple_events_rendering(self):
         """Test rendering multiple events."""
         template = WeatherTemplate()
@@ -269,10 +302,10 @@ class TestImageQuality:
 
     def test_image_mode_consistency(self):
         """Test image mode is consistent."""
-        # RGB mode
+        # Red (palette) mode
         template_rgb = DefaultTemplate(color_mode="red")
         img_rgb = template_rgb.render([])
-        assert img_rgb.mode == "RGB"
+        assert img_rgb.mode == "P"
         
         # B&W mode
         template_bw = DefaultTemplate(color_mode="bw")